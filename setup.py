@@ -70,6 +70,10 @@ setup(
             "boto3>=1.26",
             "docker>=6.0",
         ],
+        "github": [
+            "orjson>=3.9",
+            "zstandard>=0.22",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -5,19 +5,189 @@ Creates complete Android projects with modern architecture and best practices.
 """
 
 import os
-import shutil
-from typing import Dict, Any, Optional
+import re
+import functools
+import string
+from typing import Callable, Dict, Any, Optional, Tuple
 from pathlib import Path
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from .base_tool import BaseTool
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; Path.home() goes through the password database on POSIX
+_HOME = Path.home()
+
+
+class _KeepOnlyTable(dict):
+    """str.translate table that deletes every character outside a keep-set"""
+    
+    def __init__(self, keep: str):
+        super().__init__((ord(c), ord(c)) for c in keep)
+    
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+# Keywords that mark input as an Android building request
+_ANDROID_KEYWORDS = (
+    'android', 'app', 'kotlin', 'java', 'studio', 'gradle',
+    'create', 'build', 'project', 'activity', 'fragment',
+    'material', 'viewmodel', 'livedata', 'dagger', 'hilt'
+)
+_ANDROID_KEYWORDS_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _ANDROID_KEYWORDS)) + r')\b',
+    re.IGNORECASE
+)
+
+_NAME_TRANSLATE = _KeepOnlyTable(string.ascii_letters + string.digits + '_')
+_PACKAGE_TRANSLATE = _KeepOnlyTable(string.ascii_letters + string.digits + '_.')
+
+
+def _compile_template(template: str) -> list:
+    """Pre-split a format string into (literal_bytes, field_name) segments"""
+    return [
+        (literal.encode('utf-8'), field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_template_set(template_factory) -> Dict[str, list]:
+    """Get pre-split plans for every file of a template (cached per template)"""
+    return {key: _compile_template(value) for key, value in template_factory().items()}
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write pre-encoded bytes to a string path"""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+# Gradle wrapper properties
+_GRADLE_WRAPPER_PROPS = b"""distributionBase=GRADLE_USER_HOME
+distributionPath=wrapper/dists
+distributionUrl=https\\://services.gradle.org/distributions/gradle-8.5-bin.zip
+zipStoreBase=GRADLE_USER_HOME
+"""
+
+# Static README sections around the per-project parts
+_README_GETTING_STARTED = b"""
+## Getting Started
+
+1. Open this project in Android Studio
+2. Sync Gradle dependencies
+3. Run the application on an emulator or device
+
+## Features
+
+"""
+
+_README_FILE_STRUCTURE = b"""
+
+## File Structure
+
+```
+"""
+
+_README_FOOTER = b"""
+```
+
+## Build Instructions
+
+```bash
+./gradlew assembleDebug
+./gradlew assembleRelease
+```
+
+---
+
+*Generated by Terry-the-Tool-Bot v2.0 - Advanced AI Coding Assistant*
+"""
+
+# Files written for every project: (template key, path relative to the
+# project, whether the template content takes substitutions)
+_PROJECT_FILES = (
+    ('MainActivity', 'app/src/main/java/com/terry/{module_dir}/MainActivity.java', True),
+    ('activity_main', 'app/src/main/res/layout/activity_main.xml', False),
+    ('strings', 'app/src/main/res/values/strings.xml', True),
+    ('settings_gradle', 'settings.gradle.kts', True),
+    ('build_gradle', 'build.gradle.kts', True),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_writer(template_factory) -> Callable[[str, Dict[str, Any]], list]:
+    """Generate a straight-line project writer specialized for one template"""
+    template = template_factory()
+    plans = _compile_template_set(template_factory)
+    field_vars = {}
+    body = []
+    
+    for key, relative_path, formatted in _PROJECT_FILES:
+        path_parts = []
+        for literal, field_name, _, _ in string.Formatter().parse(relative_path):
+            if literal:
+                path_parts.append(repr(literal))
+            if field_name is not None:
+                path_parts.append(f"str(subs[{field_name!r}])")
+        
+        if formatted:
+            content_parts = []
+            for literal, field_name in plans[key]:
+                if literal:
+                    content_parts.append(repr(literal))
+                if field_name is not None:
+                    if field_name not in field_vars:
+                        field_vars[field_name] = f"_f{len(field_vars)}"
+                    content_parts.append(field_vars[field_name])
+            content = f"b''.join(({', '.join(content_parts)},))"
+        else:
+            content = repr(template[key].encode('utf-8'))
+        
+        body.append(f"    path = join(project_dir, {' + '.join(path_parts)})")
+        body.append(f"    write_bytes(path, {content})")
+        body.append("    files.append(path)")
+    
+    source = '\n'.join(
+        ["def write_project(project_dir, subs):"]
+        + [f"    {var} = str(subs[{name!r}]).encode('utf-8')" for name, var in field_vars.items()]
+        + ["    files = []"]
+        + body
+        + ["    return files"]
+    )
+    
+    namespace = {}
+    exec(source, {'join': os.path.join, 'write_bytes': _write_bytes}, namespace)
+    return namespace['write_project']
+
+
 class AndroidBuilderTool(BaseTool):
     """Android project builder tool"""
     
+    # Feature name -> keywords that request it
+    _FEATURE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        'material design': ('material', 'mdc', 'design'),
+        'viewbinding': ('viewbinding', 'binding'),
+        'livedata': ('livedata', 'viewmodel', 'observable'),
+        'coroutines': ('coroutine', 'async'),
+        'room database': ('room', 'database', 'dao'),
+        'dagger hilt': ('dagger', 'hilt', 'di', 'injection'),
+        'navigation': ('navigation', 'nav'),
+        'recyclerview': ('recycler', 'list', 'adapter'),
+        'retrofit': ('retrofit', 'network', 'api'),
+        'work manager': ('work', 'manager', 'background')
+    }
+    
+    # Reverse index: keyword -> feature name, in feature order
+    _FEATURE_INDEX: Dict[str, str] = {
+        keyword: feature
+        for feature, keywords in _FEATURE_KEYWORDS.items()
+        for keyword in keywords
+    }
+    
     def __init__(self):
         super().__init__(
             name="android_builder",
@@ -25,12 +195,12 @@ class AndroidBuilderTool(BaseTool):
             description="Creates complete Android projects with proper structure"
         )
         
-        # Android project templates
+        # Android project templates (built lazily on first use)
         self.templates = {
-            'basic': self._get_basic_template(),
-            'mvvm': self._get_mvvm_template(),
-            'compose': self._get_compose_template(),
-            'kmp': self._get_kmp_template()
+            'basic': self._get_basic_template,
+            'mvvm': self._get_mvvm_template,
+            'compose': self._get_compose_template,
+            'kmp': self._get_kmp_template
         }
         
         # Supported features
@@ -49,7 +219,8 @@ class AndroidBuilderTool(BaseTool):
     
     def execute(self, user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute Android project creation"""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        data = None
         
         try:
             # Extract project requirements
@@ -57,74 +228,65 @@ class AndroidBuilderTool(BaseTool):
             
             # Validate configuration
             if not self._validate_project_config(project_config):
-                return self._format_response(
-                    status='error',
-                    message='Invalid project configuration',
-                    execution_time=time.time() - start_time
-                )
-            
-            # Create project structure
-            project_path = self._create_project_structure(project_config)
-            
-            # Generate project files
-            generated_files = self._generate_android_files(project_config, project_path)
-            
-            # Setup Gradle and dependencies
-            self._setup_gradle(project_config, project_path)
-            
-            # Create README
-            self._create_readme(project_config, project_path)
-            
-            result_data = {
-                'project_name': project_config['name'],
-                'package_name': project_config['package_name'],
-                'app_type': project_config['app_type'],
-                'location': str(project_path),
-                'files_created': generated_files,
-                'features': project_config['features']
-            }
-            
-            logger.info(f"Created Android project: {project_config['name']}")
-            
-            return self._format_response(
-                status='success',
-                message=f'Successfully created Android project: {project_config["name"]}',
-                data=result_data,
-                execution_time=time.time() - start_time
-            )
+                status = 'error'
+                message = 'Invalid project configuration'
+            else:
+                # Create project structure
+                project_path = self._create_project_structure(project_config, context)
+                
+                # Generate project files
+                generated_files = self._generate_android_files(project_config, project_path)
+                
+                # Setup Gradle and dependencies
+                self._setup_gradle(project_config, project_path)
+                
+                # Create README
+                self._create_readme(project_config, project_path)
+                
+                data = {
+                    'project_name': project_config['name'],
+                    'package_name': project_config['package_name'],
+                    'app_type': project_config['app_type'],
+                    'location': str(project_path),
+                    'files_created': generated_files,
+                    'features': project_config['features']
+                }
+                
+                logger.info("Created Android project: %s", project_config['name'])
+                
+                status = 'success'
+                message = f'Successfully created Android project: {project_config["name"]}'
             
         except Exception as e:
-            logger.error(f"Android project creation failed: {str(e)}")
-            return self._format_response(
-                status='error',
-                message=f'Project creation failed: {str(e)}',
-                execution_time=time.time() - start_time
-            )
+            logger.error("Android project creation failed: %s", e)
+            status = 'error'
+            message = f'Project creation failed: {str(e)}'
+        
+        return self._format_response(
+            status=status,
+            message=message,
+            data=data,
+            execution_time=time.perf_counter() - start_time
+        )
     
     def validate_input(self, user_input: str) -> bool:
         """Validate if input is suitable for Android building"""
-        android_keywords = [
-            'android', 'app', 'kotlin', 'java', 'studio', 'gradle',
-            'create', 'build', 'project', 'activity', 'fragment',
-            'material', 'viewmodel', 'livedata', 'dagger', 'hilt'
-        ]
-        
-        user_input_lower = user_input.lower()
-        return any(keyword in user_input_lower for keyword in android_keywords)
+        return _ANDROID_KEYWORDS_RE.search(user_input) is not None
     
     def _extract_project_config(self, user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Extract project configuration from user input"""
-        import re
+        project_name = self._extract_project_name(user_input)
+        user_input_lower = user_input.lower()
         
         # Default configuration
         config = {
-            'name': self._extract_project_name(user_input),
-            'package_name': self._extract_package_name(user_input),
-            'app_type': self._detect_app_type(user_input),
+            'name': project_name,
+            'package_name': self._extract_package_name(user_input, project_name),
+            'app_type': self._detect_app_type(user_input, user_input_lower),
             'min_sdk': 24,
             'target_sdk': 34,
             'compile_sdk': 34,
-            'features': self._extract_features(user_input),
+            'features': self._extract_features(user_input, user_input_lower),
             'template': 'basic'
         }
         
@@ -154,8 +316,7 @@ class AndroidBuilderTool(BaseTool):
     def _sanitize_project_name(self, name: str) -> str:
         """Sanitize project name for file system"""
         # Remove invalid characters
-        import re
-        name = re.sub(r'[^a-zA-Z0-9_]', '', name)
+        name = name.translate(_NAME_TRANSLATE)
         
         # Ensure it doesn't start with number
         if name and name[0].isdigit():
@@ -163,7 +324,7 @@ class AndroidBuilderTool(BaseTool):
             
         return name.capitalize()
     
-    def _extract_package_name(self, user_input: str) -> str:
+    def _extract_package_name(self, user_input: str, project_name: Optional[str] = None) -> str:
         """Extract package name from user input"""
         patterns = [
             r'package "?([^"\s]+)"?',
@@ -177,14 +338,14 @@ class AndroidBuilderTool(BaseTool):
                 return self._validate_package_name(package)
         
         # Derive from project name
-        project_name = self._extract_project_name(user_input)
+        if project_name is None:
+            project_name = self._extract_project_name(user_input)
         return f"com.terry.{project_name.lower()}"
     
     def _validate_package_name(self, package: str) -> str:
         """Validate and fix package name format"""
         # Remove invalid characters
-        import re
-        package = re.sub(r'[^a-zA-Z0-9_.]', '', package)
+        package = package.translate(_PACKAGE_TRANSLATE)
         
         # Ensure reverse domain name format
         parts = package.split('.')
@@ -195,9 +356,10 @@ class AndroidBuilderTool(BaseTool):
         parts = [part.lower() for part in parts if part]
         return '.'.join(parts)
     
-    def _detect_app_type(self, user_input: str) -> str:
+    def _detect_app_type(self, user_input: str, user_input_lower: Optional[str] = None) -> str:
         """Detect app type from user input"""
-        user_input_lower = user_input.lower()
+        if user_input_lower is None:
+            user_input_lower = user_input.lower()
         
         if any(keyword in user_input_lower for keyword in ['game', 'gaming']):
             return 'game'
@@ -212,33 +374,23 @@ class AndroidBuilderTool(BaseTool):
         else:
             return 'general'
     
-    def _extract_features(self, user_input: str) -> list:
+    def _extract_features(self, user_input: str, user_input_lower: Optional[str] = None) -> list:
         """Extract desired features from user input"""
-        user_input_lower = user_input.lower()
-        detected_features = []
-        
-        feature_mapping = {
-            'material design': ['material', 'mdc', 'design'],
-            'viewbinding': ['viewbinding', 'binding'],
-            'livedata': ['livedata', 'viewmodel', 'observable'],
-            'coroutines': ['coroutine', 'async'],
-            'room database': ['room', 'database', 'dao'],
-            'dagger hilt': ['dagger', 'hilt', 'di', 'injection'],
-            'navigation': ['navigation', 'nav'],
-            'recyclerview': ['recycler', 'list', 'adapter'],
-            'retrofit': ['retrofit', 'network', 'api'],
-            'work manager': ['work', 'manager', 'background']
-        }
+        if user_input_lower is None:
+            user_input_lower = user_input.lower()
         
-        for feature, keywords in feature_mapping.items():
-            if any(keyword in user_input_lower for keyword in keywords):
-                detected_features.append(feature)
+        # Dict as an ordered set of matched features
+        detected_features = {}
+        for keyword, feature in self._FEATURE_INDEX.items():
+            if keyword in user_input_lower:
+                detected_features[feature] = None
         
-        return detected_features if detected_features else ['material_design', 'viewbinding']
+        return list(detected_features) if detected_features else ['material_design', 'viewbinding']
     
-    def _create_project_structure(self, config: Dict[str, Any]) -> Path:
+    def _create_project_structure(self, config: Dict[str, Any], context: Dict[str, Any]) -> Path:
         """Create Android project directory structure"""
-        base_dir = Path(context.get('projects_dir', Path.home() / 'TerryProjects'))
+        projects_dir = context.get('projects_dir')
+        base_dir = Path(projects_dir) if projects_dir else _HOME / 'TerryProjects'
         project_dir = base_dir / config['name']
         project_dir.mkdir(parents=True, exist_ok=True)
         
@@ -257,60 +409,36 @@ class AndroidBuilderTool(BaseTool):
             '.idea'
         ]
         
-        for directory in directories:
-            (project_dir / directory).mkdir(parents=True, exist_ok=True)
+        # Create shared parents once so sibling leaves don't repeat the stats,
+        # then create the independent leaves concurrently
+        project_dir_str = str(project_dir)
+        parents = {os.path.dirname(directory) for directory in directories}
+        for parent in sorted(parents):
+            os.makedirs(os.path.join(project_dir_str, parent), exist_ok=True)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(
+                lambda directory: os.makedirs(os.path.join(project_dir_str, directory), exist_ok=True),
+                directories
+            ))
         
         return project_dir
     
     def _generate_android_files(self, config: Dict[str, Any], project_path: Path) -> list:
         """Generate Android project files"""
-        generated_files = []
-        
-        # Select template
-        template = self.templates.get(config.get('template', 'basic'), self.templates['basic'])
-        
-        # Generate main activity
-        main_activity = template['MainActivity'].format(
-            package_name=config['package_name'],
-            class_name=config['name']
-        )
-        activity_path = project_path / f"app/src/main/java/com/terry/{config['name'].lower()}/MainActivity.java"
-        with open(activity_path, 'w') as f:
-            f.write(main_activity)
-        generated_files.append(str(activity_path))
-        
-        # Generate layout
-        layout_xml = template['activity_main']
-        layout_path = project_path / "app/src/main/res/layout/activity_main.xml"
-        with open(layout_path, 'w') as f:
-            f.write(layout_xml)
-        generated_files.append(str(layout_path))
-        
-        # Generate strings
-        strings_xml = template['strings']
-        strings_path = project_path / "app/src/main/res/values/strings.xml"
-        with open(strings_path, 'w') as f:
-            f.write(strings_xml.format(app_name=config['name']))
-        generated_files.append(str(strings_path))
-        
-        # Generate Gradle files
-        settings_gradle = template['settings_gradle']
-        build_gradle = template['build_gradle'].format(
-            package_name=config['package_name'],
-            min_sdk=config['min_sdk'],
-            target_sdk=config['target_sdk'],
-            compile_sdk=config['compile_sdk']
-        )
-        
-        with open(project_path / "settings.gradle.kts", 'w') as f:
-            f.write(settings_gradle)
-        generated_files.append(str(project_path / "settings.gradle.kts"))
-        
-        with open(project_path / "build.gradle.kts", 'w') as f:
-            f.write(build_gradle)
-        generated_files.append(str(project_path / "build.gradle.kts"))
-        
-        return generated_files
+        # Select template and its generated writer
+        template_factory = self.templates.get(config.get('template', 'basic'), self.templates['basic'])
+        write_project = _compile_writer(template_factory)
+        
+        return write_project(str(project_path), {
+            'package_name': config['package_name'],
+            'class_name': config['name'],
+            'app_name': config['name'],
+            'module_dir': config['name'].lower(),
+            'min_sdk': config['min_sdk'],
+            'target_sdk': config['target_sdk'],
+            'compile_sdk': config['compile_sdk']
+        })
     
     def _setup_gradle(self, config: Dict[str, Any], project_path: Path) -> None:
         """Setup Gradle wrapper and configuration"""
@@ -318,20 +446,11 @@ class AndroidBuilderTool(BaseTool):
         gradle_dir = project_path / 'gradle'
         gradle_dir.mkdir(exist_ok=True)
         
-        # Gradle wrapper properties
-        gradle_properties = """
-distributionBase=GRADLE_USER_HOME
-distributionPath=wrapper/dists
-distributionUrl=https\\://services.gradle.org/distributions/gradle-8.5-bin.zip
-zipStoreBase=GRADLE_USER_HOME
-"""
-        
-        with open(gradle_dir / 'gradle-wrapper.properties', 'w') as f:
-            f.write(gradle_properties)
+        (gradle_dir / 'gradle-wrapper.properties').write_bytes(_GRADLE_WRAPPER_PROPS)
     
     def _create_readme(self, config: Dict[str, Any], project_path: Path) -> None:
         """Create README.md for the project"""
-        readme_content = f"""# {config['name']}
+        project_info = f"""# {config['name']}
 
 An Android application created by Terry-the-Tool-Bot.
 
@@ -342,37 +461,18 @@ An Android application created by Terry-the-Tool-Bot.
 - **Minimum SDK**: {config['min_sdk']}
 - **Target SDK**: {config['target_sdk']}
 - **Features**: {', '.join(config['features'])}
-
-## Getting Started
-
-1. Open this project in Android Studio
-2. Sync Gradle dependencies
-3. Run the application on an emulator or device
-
-## Features
-
-{self._format_features(config['features'])}
-
-## File Structure
-
-```
-{self._get_project_structure(config['name'])}
-```
-
-## Build Instructions
-
-```bash
-./gradlew assembleDebug
-./gradlew assembleRelease
-```
-
----
-
-*Generated by Terry-the-Tool-Bot v2.0 - Advanced AI Coding Assistant*
 """
         
-        with open(project_path / 'README.md', 'w') as f:
-            f.write(readme_content)
+        readme_content = b''.join((
+            project_info.encode('utf-8'),
+            _README_GETTING_STARTED,
+            self._format_features(config['features']).encode('utf-8'),
+            _README_FILE_STRUCTURE,
+            self._get_project_structure(config['name']).encode('utf-8'),
+            _README_FOOTER
+        ))
+        
+        (project_path / 'README.md').write_bytes(readme_content)
     
     def _format_features(self, features: list) -> str:
         """Format features for README"""
@@ -423,18 +523,20 @@ An Android application created by Terry-the-Tool-Bot.
         
         for field in required_fields:
             if not config.get(field):
-                logger.error(f"Missing required field: {field}")
+                logger.error("Missing required field: %s", field)
                 return False
         
         # Validate package name format
         package = config['package_name']
         if not package.count('.') >= 2:
-            logger.error(f"Invalid package name format: {package}")
+            logger.error("Invalid package name format: %s", package)
             return False
         
         return True
     
-    def _get_basic_template(self) -> Dict[str, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_basic_template() -> Dict[str, str]:
         """Get basic Android project template"""
         return {
             'MainActivity': '''package {package_name};
@@ -498,7 +600,25 @@ public class MainActivity extends AppCompatActivity {{
 <resources>
     <string name="app_name">{app_name}</string>
 </resources>''',
-            'settings_gradle': '''
+            'settings_gradle': '''pluginManagement {{
+    repositories {{
+        google()
+        mavenCentral()
+        gradlePluginPortal()
+    }}
+}}
+
+dependencyResolutionManagement {{
+    repositories {{
+        google()
+        mavenCentral()
+    }}
+}}
+
+rootProject.name = "{app_name}"
+include(":app")
+''',
+            'build_gradle': '''
 // Top-level build file where you can add configuration options common to all sub-projects/modules.
 plugins {{
     id 'com.android.application'
@@ -506,11 +626,11 @@ plugins {{
 }}
 
 android {{
-    compileSdk 34
+    compileSdk {compile_sdk}
     defaultConfig {{
         applicationId "{package_name}"
-        minSdk 24
-        targetSdk 34
+        minSdk {min_sdk}
+        targetSdk {target_sdk}
         versionCode 1
         versionName "1.0"
         
@@ -546,17 +666,23 @@ android {{
 }}'''
         }
     
-    def _get_mvvm_template(self) -> Dict[str, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_mvvm_template() -> Dict[str, str]:
         """Get MVVM template with LiveData and ViewModel"""
         # Implementation would include MVVM architecture
-        return self._get_basic_template()
+        return AndroidBuilderTool._get_basic_template()
     
-    def _get_compose_template(self) -> Dict[str, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_compose_template() -> Dict[str, str]:
         """Get Jetpack Compose template"""
         # Implementation would include Jetpack Compose
-        return self._get_basic_template()
+        return AndroidBuilderTool._get_basic_template()
     
-    def _get_kmp_template(self) -> Dict[str, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_kmp_template() -> Dict[str, str]:
         """Get Kotlin Multiplatform template"""
         # Implementation would include KMP structure
-        return self._get_basic_template()
\ No newline at end of file
+        return AndroidBuilderTool._get_basic_template()
\ No newline at end of file
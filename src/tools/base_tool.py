@@ -5,7 +5,7 @@ Provides abstract base class for all tools in Terry's modular system.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 import logging
 import time
 
@@ -14,6 +14,15 @@ logger = logging.getLogger(__name__)
 class BaseTool(ABC):
     """Abstract base class for all Terry tools"""
     
+    # Tool capabilities (to be overridden by subclasses)
+    _CAPABILITIES: frozenset = frozenset({
+        'execute',
+        'validate_input',
+        'get_info',
+        'activate',
+        'deactivate'
+    })
+    
     def __init__(self, name: str, version: str, description: str):
         self.name = name
         self.version = version
@@ -22,8 +31,10 @@ class BaseTool(ABC):
         self.execution_count = 0
         self.success_count = 0
         self.last_used = None
+        self._info_cache = None
+        self._info_dirty = True
         
-        logger.info(f"Initialized tool: {name} v{version}")
+        logger.info("Initialized tool: %s v%s", name, version)
         
     @abstractmethod
     def execute(self, user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -62,26 +73,32 @@ class BaseTool(ABC):
     
     def get_info(self) -> Dict[str, Any]:
         """Get comprehensive tool information"""
-        return {
-            'name': self.name,
-            'version': self.version,
-            'description': self.description,
-            'active': self.active,
-            'execution_count': self.execution_count,
-            'success_count': self.success_count,
-            'success_rate': self.success_count / max(self.execution_count, 1),
-            'last_used': self.last_used
-        }
+        if self._info_dirty or self._info_cache is None:
+            self._info_cache = {
+                'name': self.name,
+                'version': self.version,
+                'description': self.description,
+                'active': self.active,
+                'execution_count': self.execution_count,
+                'success_count': self.success_count,
+                'success_rate': self.success_count / self.execution_count if self.execution_count else 0.0,
+                'last_used': self.last_used
+            }
+            self._info_dirty = False
+        # Copy so callers can't change the cached dict
+        return dict(self._info_cache)
     
     def activate(self) -> None:
         """Activate the tool"""
         self.active = True
-        logger.info(f"Tool {self.name} activated")
+        self._info_dirty = True
+        logger.info("Tool %s activated", self.name)
         
     def deactivate(self) -> None:
         """Deactivate the tool"""
         self.active = False
-        logger.info(f"Tool {self.name} deactivated")
+        self._info_dirty = True
+        logger.info("Tool %s deactivated", self.name)
         
     def _record_execution(self, success: bool) -> None:
         """Record tool execution statistics"""
@@ -89,6 +106,7 @@ class BaseTool(ABC):
         if success:
             self.success_count += 1
         self.last_used = time.time()
+        self._info_dirty = True
         
     def _validate_permission(self, context: Dict[str, Any], required_permission: str) -> bool:
         """Check if required permission is available"""
@@ -97,7 +115,7 @@ class BaseTool(ABC):
         
     def _get_tool_function(self, function_name: str) -> Optional[callable]:
         """Get tool function by name (for dynamic calling)"""
-        return getattr(self, function_name, None) if hasattr(self, function_name) else None
+        return getattr(self, function_name, None)
         
     def _format_response(self, status: str, message: str, data: Any = None, execution_time: float = 0) -> Dict[str, Any]:
         """Format standardized response"""
@@ -112,16 +130,6 @@ class BaseTool(ABC):
             'version': self.version
         }
         
-    def _get_capabilities(self) -> List[str]:
-        """Get list of tool capabilities (to be overridden by subclasses)"""
-        return [
-            'execute',
-            'validate_input',
-            'get_info',
-            'activate',
-            'deactivate'
-        ]
-        
     def supports_function(self, function_name: str) -> bool:
         """Check if tool supports a specific function"""
-        return function_name in self._get_capabilities()
\ No newline at end of file
+        return function_name in self._CAPABILITIES
\ No newline at end of file
@@ -3,22 +3,98 @@ Cross-Platform Git Interface - Unified Git operations across Windows, macOS, and
 Provides platform-specific Git managers with consistent interface
 """
 
+import functools
 import platform
+import os
+import re
+import shlex
+import subprocess
+import threading
+import time
+from datetime import datetime
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 import logging
 
+# Resolved once per process; platform.system() probes uname on first use
+_SYSTEM = platform.system()
+
+_PLATFORM_INFO = {
+    'system': _SYSTEM,
+    'is_windows': _SYSTEM == "Windows",
+    'is_macos': _SYSTEM == "Darwin",
+    'is_linux': _SYSTEM == "Linux",
+    'supports_powershell': _SYSTEM == "Windows",
+    'path_separator': '\\' if _SYSTEM == "Windows" else '/',
+    'git_executable': 'git.exe' if _SYSTEM == "Windows" else 'git'
+}
+
+# Clone options for the add-a-file/commit/push workflow: only the latest commit,
+# blobs fetched on demand, and only top-level files checked out
+SHALLOW_CLONE_OPTIONS = '--depth=1 --filter=blob:none --sparse'
+
+# How long a cached `git status` may be reused while index and HEAD are unchanged.
+# Worktree edits don't touch either file, so staleness is bounded by this TTL.
+_STATUS_CACHE_TTL = 2.0
+
+# First line of `git commit` output: "[main abc1234] msg" or "[main (root-commit) abc1234] msg"
+_COMMIT_SUMMARY_RE = re.compile(r'^\[.*? ([0-9a-f]{4,})\] ')
+
+def _parse_porcelain_v2(blob: str) -> Dict[str, tuple]:
+    """Parse `git status --porcelain=v2` output into parallel columns.
+    
+    Returns paths, xy (two-letter status), modes (worktree mode; 0 for untracked or
+    ignored) and orig_paths (rename/copy source, '' otherwise), one entry per changed path.
+    """
+    paths, xy, modes, orig_paths = [], [], [], []
+    for line in blob.splitlines():
+        kind = line[:1]
+        if kind == '1':
+            fields = line.split(' ', 8)
+            path, orig = fields[8], ''
+        elif kind == '2':
+            fields = line.split(' ', 9)
+            path, _, orig = fields[9].partition('\t')
+        elif kind == 'u':
+            fields = line.split(' ', 10)
+            path, orig = fields[10], ''
+            fields[5] = fields[6]  # worktree mode follows the three stage modes
+        elif kind in ('?', '!'):
+            paths.append(line[2:])
+            xy.append(kind * 2)
+            modes.append(0)
+            orig_paths.append('')
+            continue
+        else:
+            # "# branch.*" headers and anything unrecognized
+            continue
+        paths.append(path)
+        xy.append(fields[1])
+        modes.append(int(fields[5], 8))
+        orig_paths.append(orig)
+    return {
+        'paths': tuple(paths),
+        'xy': tuple(xy),
+        'modes': tuple(modes),
+        'orig_paths': tuple(orig_paths)
+    }
+
+
 class CrossPlatformGitManager(ABC):
     """Abstract base class for platform-specific Git managers"""
     
     @abstractmethod
-    def execute_git_command(self, command: str, cwd: Optional[str] = None) -> Dict[str, Any]:
-        """Execute Git command"""
+    def execute_git_command(self, command: str, cwd: Optional[str] = None,
+                            input_data: Optional[str] = None, capture: bool = True) -> Dict[str, Any]:
+        """Execute Git command, optionally feeding input_data to its stdin.
+        
+        With capture=False stdout is discarded and stderr is only kept on failure.
+        """
         pass
     
     @abstractmethod
-    def clone_repository(self, repo_url: str, target_path: str) -> Dict[str, Any]:
-        """Clone repository"""
+    def clone_repository(self, repo_url: str, target_path: str, shallow: bool = False) -> Dict[str, Any]:
+        """Clone repository (shallow: latest commit only, blobs on demand, sparse checkout)"""
         pass
     
     @abstractmethod
@@ -53,19 +129,24 @@ class CrossPlatformGitManager(ABC):
 
 
 class WindowsGitManager(CrossPlatformGitManager):
-    """Windows-specific Git manager using PowerShell integration"""
+    """Windows-specific Git manager (PowerShell integration is opt-in)"""
     
     def __init__(self):
         from .windows_git_manager import WindowsGitManager as WGM
         self._manager = WGM()
     
-    def execute_git_command(self, command: str, cwd: Optional[str] = None) -> Dict[str, Any]:
-        """Execute Git command using Windows manager"""
-        return self._manager.execute_git_command(command, cwd)
+    def close(self) -> None:
+        """Stop the persistent PowerShell host"""
+        self._manager.close()
     
-    def clone_repository(self, repo_url: str, target_path: str) -> Dict[str, Any]:
+    def execute_git_command(self, command: str, cwd: Optional[str] = None,
+                            input_data: Optional[str] = None, capture: bool = True) -> Dict[str, Any]:
+        """Execute Git command using Windows manager (output is always captured)"""
+        return self._manager.execute_git_command(command, cwd, input_data)
+    
+    def clone_repository(self, repo_url: str, target_path: str, shallow: bool = False) -> Dict[str, Any]:
         """Clone repository using Windows manager"""
-        return self._manager.clone_repository(repo_url, target_path)
+        return self._manager.clone_repository(repo_url, target_path, shallow)
     
     def get_status(self, repo_path: str = '.') -> Dict[str, Any]:
         """Get Git status using Windows manager"""
@@ -109,28 +190,121 @@ class WindowsGitManager(CrossPlatformGitManager):
         return self._manager.execute_git_command(command, repo_path)
 
 
+class _GitSession:
+    """Long-running `git cat-file --batch-check` process for one repository"""
+    
+    def __init__(self, git_executable: str, repo_path: str, **popen_kw):
+        self.repo_path = repo_path
+        self._lock = threading.Lock()
+        self._process = subprocess.Popen(
+            [git_executable, 'cat-file', '--batch-check'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=repo_path,
+            text=True,
+            bufsize=1,
+            **popen_kw
+        )
+    
+    @property
+    def alive(self) -> bool:
+        """Whether the underlying git process is still running"""
+        return self._process.poll() is None
+    
+    def resolve(self, revision: str) -> Optional[str]:
+        """Resolve a revision to its full object hash, or None if missing"""
+        with self._lock:
+            if not self.alive:
+                return None
+            self._process.stdin.write(revision + '\n')
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+        
+        # "<hash> <type> <size>" on success, "<revision> missing" otherwise
+        parts = line.split()
+        return parts[0] if len(parts) == 3 else None
+    
+    def close(self) -> None:
+        """Stop the git process"""
+        if self.alive:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+
 class UnixGitManager(CrossPlatformGitManager):
-    """Unix/Linux/macOS Git manager using shell commands"""
+    """Unix/Linux/macOS Git manager invoking git directly"""
     
     def __init__(self):
-        self.system = platform.system()
+        self.system = _SYSTEM
         self.git_executable = 'git'
-        logging.info(f"Initialized UnixGitManager for {self.system}")
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        self._status_cache = {}
+        logging.info("Initialized UnixGitManager for %s", self.system)
     
-    def execute_git_command(self, command: str, cwd: Optional[str] = None) -> Dict[str, Any]:
-        """Execute Git command using shell"""
-        import subprocess
-        
+    def _get_session(self, repo_path: str) -> _GitSession:
+        """Get (or start) the persistent git session for a repository"""
+        key = os.path.abspath(repo_path)
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session is None or not session.alive:
+                session = _GitSession(self.git_executable, key)
+                self._sessions[key] = session
+            return session
+    
+    def close(self) -> None:
+        """Stop all persistent git sessions"""
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _git_argv(self, command: str, cwd: Optional[str] = None) -> list:
+        """Build git argv; the working directory is passed as `-C` rather than chdir-ing the child"""
+        if cwd:
+            return [self.git_executable, '-C', cwd, *shlex.split(command)]
+        return [self.git_executable, *shlex.split(command)]
+    
+    def execute_git_command(self, command: str, cwd: Optional[str] = None,
+                            input_data: Optional[str] = None, capture: bool = True) -> Dict[str, Any]:
+        """Execute Git command directly, without an intermediate shell"""
         try:
-            # Build full command
-            full_command = f'cd "{cwd or os.getcwd()}" && {self.git_executable} {command}'
+            args = self._git_argv(command, cwd)
+            
+            if not capture:
+                # Binary mode, stdout discarded; stderr only decoded on failure
+                result = subprocess.run(
+                    args,
+                    input=input_data.encode() if input_data is not None else None,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=60
+                )
+                return {
+                    'success': result.returncode == 0,
+                    'stdout': '',
+                    'stderr': result.stderr.decode(errors='replace') if result.returncode else '',
+                    'return_code': result.returncode,
+                    'execution_method': 'Direct',
+                    'platform': self.system
+                }
             
             result = subprocess.run(
-                full_command,
-                shell=True,
+                args,
+                input=input_data,
                 capture_output=True,
                 text=True,
-                cwd=cwd,
                 timeout=60
             )
             
@@ -139,7 +313,7 @@ class UnixGitManager(CrossPlatformGitManager):
                 'stdout': result.stdout,
                 'stderr': result.stderr,
                 'return_code': result.returncode,
-                'execution_method': 'Shell',
+                'execution_method': 'Direct',
                 'platform': self.system
             }
             
@@ -150,7 +324,7 @@ class UnixGitManager(CrossPlatformGitManager):
                 'stdout': '',
                 'stderr': '',
                 'return_code': -1,
-                'execution_method': 'Shell',
+                'execution_method': 'Direct',
                 'platform': self.system
             }
         except Exception as e:
@@ -160,20 +334,20 @@ class UnixGitManager(CrossPlatformGitManager):
                 'stdout': '',
                 'stderr': '',
                 'return_code': -1,
-                'execution_method': 'Shell',
+                'execution_method': 'Direct',
                 'platform': self.system
             }
     
-    def clone_repository(self, repo_url: str, target_path: str) -> Dict[str, Any]:
+    def clone_repository(self, repo_url: str, target_path: str, shallow: bool = False) -> Dict[str, Any]:
         """Clone repository on Unix systems"""
-        import subprocess
-        import os
-        
         try:
             # Create target directory if it doesn't exist
             os.makedirs(target_path, exist_ok=True)
             
-            command = f'clone {repo_url} "{target_path}"'
+            command = 'clone '
+            if shallow:
+                command += f'{SHALLOW_CLONE_OPTIONS} '
+            command += f'{shlex.quote(repo_url)} {shlex.quote(target_path)}'
             result = self.execute_git_command(command)
             
             if result['success']:
@@ -200,30 +374,45 @@ class UnixGitManager(CrossPlatformGitManager):
                 'platform': self.system
             }
     
+    @staticmethod
+    def _status_cache_key(repo_path: str) -> Optional[tuple]:
+        """Get the (index, HEAD) mtimes used to validate a cached status"""
+        git_dir = os.path.join(repo_path, '.git')
+        try:
+            return (
+                os.stat(os.path.join(git_dir, 'index')).st_mtime_ns,
+                os.stat(os.path.join(git_dir, 'HEAD')).st_mtime_ns
+            )
+        except OSError:
+            return None
+    
     def get_status(self, repo_path: str = '.') -> Dict[str, Any]:
         """Get Git status on Unix systems"""
-        import os
-        
         try:
-            # Change to repository directory
-            original_cwd = os.getcwd()
-            os.chdir(repo_path)
-            
-            result = self.execute_git_command('status --porcelain=v2')
+            cache_path = os.path.abspath(repo_path)
+            cache_key = self._status_cache_key(cache_path)
+            cached = self._status_cache.get(cache_path)
+            if (cache_key is not None and cached is not None and cached[0] == cache_key
+                    and time.monotonic() - cached[1] < _STATUS_CACHE_TTL):
+                return dict(cached[2])
             
-            # Restore original directory
-            os.chdir(original_cwd)
+            result = self.execute_git_command('status --porcelain=v2', cwd=repo_path)
             
             if result['success']:
-                import subprocess
-                timestamp = subprocess.run(['date'], capture_output=True, text=True).stdout.strip()
-                return {
+                timestamp = datetime.now().isoformat()
+                status = {
                     'success': True,
                     'status': result['stdout'],
+                    **_parse_porcelain_v2(result['stdout']),
                     'repo_path': repo_path,
                     'timestamp': timestamp,
                     'platform': self.system
                 }
+                # Re-read the key: status may refresh (rewrite) the index itself
+                cache_key = self._status_cache_key(cache_path)
+                if cache_key is not None:
+                    self._status_cache[cache_path] = (cache_key, time.monotonic(), status)
+                return dict(status)
             else:
                 return {
                     'success': False,
@@ -242,29 +431,23 @@ class UnixGitManager(CrossPlatformGitManager):
     
     def commit_changes(self, message: str, files: Optional[list] = None, repo_path: str = '.') -> Dict[str, Any]:
         """Commit changes on Unix systems"""
-        import os
-        
         try:
-            # Change to repository directory
-            original_cwd = os.getcwd()
-            os.chdir(repo_path)
-            
-            # Add files
+            # Add files (all patterns in one invocation)
             if files:
-                for file_pattern in files:
-                    add_result = self.execute_git_command(f'add "{file_pattern}"')
-                    if not add_result['success']:
-                        os.chdir(original_cwd)
-                        return {
-                            'success': False,
-                            'error': f'Failed to add files: {add_result.get("stderr")}',
-                            'platform': self.system
-                        }
+                add_result = self.execute_git_command(
+                    'add -- ' + ' '.join(shlex.quote(file_pattern) for file_pattern in files),
+                    cwd=repo_path
+                )
+                if not add_result['success']:
+                    return {
+                        'success': False,
+                        'error': f'Failed to add files: {add_result.get("stderr")}',
+                        'platform': self.system
+                    }
             else:
                 # Add all changes
-                add_result = self.execute_git_command('add -A')
+                add_result = self.execute_git_command('add -A', cwd=repo_path)
                 if not add_result['success']:
-                    os.chdir(original_cwd)
                     return {
                         'success': False,
                         'error': f'Failed to add all files: {add_result.get("stderr")}',
@@ -272,18 +455,15 @@ class UnixGitManager(CrossPlatformGitManager):
                     }
             
             # Create commit
-            commit_result = self.execute_git_command(f'commit -m "{message}"')
-            
-            # Restore original directory
-            os.chdir(original_cwd)
+            commit_result = self.execute_git_command(f'commit -m {shlex.quote(message)}', cwd=repo_path)
             
             if commit_result['success']:
-                # Get commit hash
-                hash_result = self.execute_git_command('rev-parse HEAD')
-                commit_hash = hash_result.get('stdout', '').strip() if hash_result['success'] else 'unknown'
+                # Expand the short hash git printed (falls back to HEAD) via the persistent session
+                match = _COMMIT_SUMMARY_RE.match(commit_result['stdout'])
+                revision = match.group(1) if match else 'HEAD'
+                commit_hash = self._get_session(repo_path).resolve(revision) or 'unknown'
                 
-                import subprocess
-                timestamp = subprocess.run(['date'], capture_output=True, text=True).stdout.strip()
+                timestamp = datetime.now().isoformat()
                 
                 return {
                     'success': True,
@@ -314,24 +494,35 @@ class UnixGitManager(CrossPlatformGitManager):
         command = f'push {remote}'
         if branch:
             command += f' {branch}'
-        return self.execute_git_command(command, repo_path)
+        return self.execute_git_command(command, repo_path, capture=False)
     
     def pull_changes(self, remote: str = 'origin', branch: str = None, repo_path: str = '.') -> Dict[str, Any]:
         """Pull changes from remote on Unix systems"""
         command = f'pull {remote}'
         if branch:
             command += f' {branch}'
-        return self.execute_git_command(command, repo_path)
+        return self.execute_git_command(command, repo_path, capture=False)
     
     def create_branch(self, branch_name: str, base_branch: str = 'main', repo_path: str = '.') -> Dict[str, Any]:
         """Create new branch on Unix systems"""
         command = f'checkout -b {branch_name} {base_branch}'
         return self.execute_git_command(command, repo_path)
     
+    @staticmethod
+    def _current_branch(repo_path: str) -> Optional[str]:
+        """Read the checked-out branch from .git/HEAD without spawning git"""
+        try:
+            with open(os.path.join(repo_path, '.git', 'HEAD')) as f:
+                head = f.read().strip()
+        except OSError:
+            return None
+        prefix = 'ref: refs/heads/'
+        return head[len(prefix):] if head.startswith(prefix) else None
+    
     def merge_branch(self, source_branch: str, target_branch: str = None, repo_path: str = '.') -> Dict[str, Any]:
         """Merge branches on Unix systems"""
-        # First ensure we're on the target branch
-        if target_branch:
+        # First ensure we're on the target branch (skipped when already checked out)
+        if target_branch and target_branch != self._current_branch(repo_path):
             checkout_result = self.execute_git_command(f'checkout {target_branch}', repo_path)
             if not checkout_result['success']:
                 return checkout_result
@@ -341,36 +532,26 @@ class UnixGitManager(CrossPlatformGitManager):
         return self.execute_git_command(command, repo_path)
 
 
+# Manager class per platform.system() value; anything unlisted is treated as Unix
+_MANAGER_CTORS = {
+    "Windows": WindowsGitManager,
+    "Darwin": UnixGitManager,
+    "Linux": UnixGitManager
+}
+
+
 class GitManagerFactory:
     """Factory for creating platform-specific Git managers"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def create_manager():
-        """Create appropriate Git manager for current platform"""
-        system = platform.system()
-        
-        logging.info(f"Creating Git manager for platform: {system}")
-        
-        if system == "Windows":
-            return WindowsGitManager()
-        elif system == "Darwin":  # macOS
-            logging.info("Using UnixGitManager for macOS")
-            return UnixGitManager()
-        else:  # Linux and other Unix-like systems
-            logging.info("Using UnixGitManager for Linux/Unix")
-            return UnixGitManager()
+        """Create appropriate Git manager for current platform (shared per process)"""
+        manager_cls = _MANAGER_CTORS.get(_SYSTEM, UnixGitManager)
+        logging.info("Using %s for platform: %s", manager_cls.__name__, _SYSTEM)
+        return manager_cls()
     
     @staticmethod
     def get_platform_info():
-        """Get platform information for Git operations"""
-        system = platform.system()
-        
-        return {
-            'system': system,
-            'is_windows': system == "Windows",
-            'is_macos': system == "Darwin",
-            'is_linux': system == "Linux",
-            'supports_powershell': system == "Windows",
-            'path_separator': '\\' if system == "Windows" else '/',
-            'git_executable': 'git.exe' if system == "Windows" else 'git'
-        }
\ No newline at end of file
+        """Get platform information for Git operations (computed at import)"""
+        return _PLATFORM_INFO
\ No newline at end of file
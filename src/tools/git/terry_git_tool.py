@@ -3,17 +3,161 @@ Terry Git Tool - Comprehensive Git integration for Terry-the-Tool-Bot
 Windows 10/11 optimized with cross-platform support
 """
 
+import asyncio
+import functools
 import time
-import platform
 import subprocess
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import re
 
-from .cross_platform_git import GitManagerFactory
+from .cross_platform_git import GitManagerFactory, _SYSTEM
 from ..base_tool import BaseTool
 
+@functools.lru_cache(maxsize=None)
+def _detect_git_version() -> Optional[str]:
+    """Get the installed Git version string (checked once per process)"""
+    try:
+        result = subprocess.run(['git', '--version'], capture_output=True, text=True)
+    except Exception as e:
+        logging.error(f"Failed to check Git installation: {e}")
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _extract_first_group(match: re.Match) -> List[str]:
+    return [match.group(1)] if match else []
+
+
+def _extract_stripped_groups(match: re.Match) -> List[str]:
+    return [arg.strip() for arg in match.groups() if arg and arg.strip()]
+
+
+def _extract_groups(match: re.Match) -> List[str]:
+    return [arg for arg in match.groups() if arg and arg.strip()]
+
+
+def _extract_nothing(match: re.Match) -> List[str]:
+    return []
+
+
+def _extract_init_path(match: re.Match) -> List[str]:
+    return [match.group(1)] if match and match.group(1) else ['.']
+
+
+def _extract_add_pattern(match: re.Match) -> List[str]:
+    return [match.group(1)] if match else ['.']
+
+
+# Comprehensive Git operation patterns: (operation, compiled patterns, argument extractor)
+_GIT_OPERATIONS = [
+    # Repository operations
+    ('clone', [
+        re.compile(r'clone\s+(?:shallow\s+)?(https?://[^\s]+)'),
+        re.compile(r'clone\s+(?:shallow\s+)?(git@[^\s]+)'),
+        re.compile(r'clone\s+(?:shallow\s+)?([^\s]+\.[^\s]+)')
+    ], _extract_first_group),
+    
+    # Commit operations
+    ('commit', [
+        re.compile(r'commit\s+with\s+message\s+["\']?([^"\'\n]+)["\']?'),
+        re.compile(r'commit\s+["\']?([^"\'\n]+)["\']?'),
+        re.compile(r'commit\s+-m\s+["\']?([^"\'\n]+)["\']?')
+    ], _extract_first_group),
+    
+    # Push operations
+    ('push', [
+        re.compile(r'push\s+(?:to\s+)?([^\s]+)?'),
+        re.compile(r'push\s+(?:origin|upstream|remote)?'),
+        re.compile(r'push\s+(?:to\s+)?origin(?:\s+.+)?')
+    ], _extract_stripped_groups),
+    
+    # Pull operations
+    ('pull', [
+        re.compile(r'pull\s+(?:from\s+)?([^\s]+)?'),
+        re.compile(r'pull\s+(?:origin|upstream|remote)?'),
+        re.compile(r'pull\s+(?:from\s+)?origin(?:\s+.+)?')
+    ], _extract_stripped_groups),
+    
+    # Branch operations
+    ('branch', [
+        re.compile(r'(?:create|new)\s+branch\s+([^\s]+)'),
+        re.compile(r'create\s+branch\s+([^\s]+)'),
+        re.compile(r'checkout\s+-b\s+([^\s]+)'),
+        re.compile(r'branch\s+([^\s]+)')
+    ], _extract_first_group),
+    
+    # Merge operations
+    ('merge', [
+        re.compile(r'merge\s+([^\s]+)'),
+        re.compile(r'merge\s+([^\s]+)\s+into\s+([^\s]+)')
+    ], _extract_groups),
+    
+    # Status operations
+    ('status', [
+        re.compile(r'(?:git\s+)?status'),
+        re.compile(r'check\s+status'),
+        re.compile(r'get\s+status'),
+        re.compile(r'show\s+status')
+    ], _extract_nothing),
+    
+    # Init operations
+    ('init', [
+        re.compile(r'init\s+(?:repo|repository)?\s*([^\s]+)?'),
+        re.compile(r'initialize\s+(?:repo|repository)?\s*([^\s]+)?'),
+        re.compile(r'create\s+(?:repo|repository)?\s*([^\s]+)?')
+    ], _extract_init_path),
+    
+    # Add operations
+    ('add', [
+        re.compile(r'add\s+([^\s]+)'),
+        re.compile(r'stage\s+([^\s]+)'),
+        re.compile(r'add\s+all'),
+        re.compile(r'add\s+\.')
+    ], _extract_add_pattern)
+]
+
+
+# Help text returned by TerryGitTool.get_help_text
+_HELP_TEXT = """
+🔧 Terry Git Tool - Comprehensive Git Operations
+
+📋 Supported Operations:
+• clone <url> - Clone a repository
+• shallow clone <url> - Clone only the latest commit (sparse checkout)
+• commit with message "<message>" - Commit changes
+• push [remote] [branch] - Push to remote
+• pull [remote] [branch] - Pull from remote  
+• create branch <name> - Create new branch
+• merge <source> [into <target>] - Merge branches
+• status - Show repository status
+• init [path] - Initialize repository
+• add <files> - Add files to staging
+
+🌐 Platform Support:
+• Windows 10/11 with optional PowerShell integration (TERRY_USE_POWERSHELL=1)
+• macOS with shell commands
+• Linux with bash commands
+• Long path support on Windows
+• Cross-platform path handling
+
+💡 Examples:
+• "clone https://github.com/user/repo.git"
+• "commit with message 'Fixed bug in login'"
+• "push to origin main"  
+• "create branch feature/new-ui"
+• "merge feature/new-ui into main"
+• "check status"
+""".strip()
+
+# Whole-word Git keywords accepted by validate_input
+_VALIDATE_RE = re.compile(
+    r'\b(?:clone|commit|push|pull|branch|merge|status|add|init|checkout|repository|repo|git)\b',
+    re.IGNORECASE
+)
+
+
 class TerryGitTool(BaseTool):
     """Comprehensive Git integration tool for Terry-the-Tool-Bot with Windows support"""
     
@@ -24,12 +168,13 @@ class TerryGitTool(BaseTool):
             description="Advanced Git operations with Windows 10/11 compatibility"
         )
         
-        self.platform = platform.system()
+        self.platform = _SYSTEM
         self.git_manager = GitManagerFactory.create_manager()
         self.platform_info = GitManagerFactory.get_platform_info()
+        self._status_info = None
         
-        logging.info(f"Initialized TerryGitTool for {self.platform}")
-        logging.info(f"Platform info: {self.platform_info}")
+        logging.info("Initialized TerryGitTool for %s", self.platform)
+        logging.info("Platform info: %s", self.platform_info)
         
         # Platform-specific initialization
         if self.platform == "Windows":
@@ -40,15 +185,11 @@ class TerryGitTool(BaseTool):
         logging.info("Initializing Windows-specific Git features")
         
         # Check for Windows-specific requirements
-        try:
-            import subprocess
-            result = subprocess.run(['git', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                logging.info(f"Git version: {result.stdout.strip()}")
-            else:
-                logging.warning("Git not found or not properly installed")
-        except Exception as e:
-            logging.error(f"Failed to check Git installation: {e}")
+        git_version = _detect_git_version()
+        if git_version:
+            logging.info("Git version: %s", git_version)
+        else:
+            logging.warning("Git not found or not properly installed")
     
     def execute(self, user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute Git operations based on user input"""
@@ -89,116 +230,25 @@ class TerryGitTool(BaseTool):
                 execution_time=time.time() - start_time
             )
     
+    async def execute_async(self, user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute Git operations without blocking the caller's event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute, user_input, context)
+    
     def _parse_git_intent(self, user_input: str) -> Optional[Dict[str, Any]]:
         """Parse user input to determine Git operation"""
         input_lower = user_input.lower()
         
-        # Comprehensive Git operation patterns
-        operations = {
-            # Repository operations
-            'clone': {
-                'patterns': [
-                    r'clone\s+(https?://[^\s]+)',
-                    r'clone\s+(git@[^\s]+)',
-                    r'clone\s+([^\s]+\.[^\s]+)'
-                ],
-                'extract_args': lambda match: [match.group(1)] if match else []
-            },
-            
-            # Commit operations
-            'commit': {
-                'patterns': [
-                    r'commit\s+with\s+message\s+["\']?([^"\'\n]+)["\']?',
-                    r'commit\s+["\']?([^"\'\n]+)["\']?',
-                    r'commit\s+-m\s+["\']?([^"\'\n]+)["\']?'
-                ],
-                'extract_args': lambda match: [match.group(1)] if match else []
-            },
-            
-            # Push operations
-            'push': {
-                'patterns': [
-                    r'push\s+(?:to\s+)?([^\s]+)?',
-                    r'push\s+(?:origin|upstream|remote)?',
-                    r'push\s+(?:to\s+)?origin(?:\s+.+)?'
-                ],
-                'extract_args': lambda match: [arg.strip() for arg in match.groups() if arg and arg.strip()]
-            },
-            
-            # Pull operations
-            'pull': {
-                'patterns': [
-                    r'pull\s+(?:from\s+)?([^\s]+)?',
-                    r'pull\s+(?:origin|upstream|remote)?',
-                    r'pull\s+(?:from\s+)?origin(?:\s+.+)?'
-                ],
-                'extract_args': lambda match: [arg.strip() for arg in match.groups() if arg and arg.strip()]
-            },
-            
-            # Branch operations
-            'branch': {
-                'patterns': [
-                    r'(?:create|new)\s+branch\s+([^\s]+)',
-                    r'create\s+branch\s+([^\s]+)',
-                    r'checkout\s+-b\s+([^\s]+)',
-                    r'branch\s+([^\s]+)'
-                ],
-                'extract_args': lambda match: [match.group(1)] if match else []
-            },
-            
-            # Merge operations
-            'merge': {
-                'patterns': [
-                    r'merge\s+([^\s]+)',
-                    r'merge\s+([^\s]+)\s+into\s+([^\s]+)'
-                ],
-                'extract_args': lambda match: [arg for arg in match.groups() if arg and arg.strip()]
-            },
-            
-            # Status operations
-            'status': {
-                'patterns': [
-                    r'(?:git\s+)?status',
-                    r'check\s+status',
-                    r'get\s+status',
-                    r'show\s+status'
-                ],
-                'extract_args': lambda match: []
-            },
-            
-            # Init operations
-            'init': {
-                'patterns': [
-                    r'init\s+(?:repo|repository)?\s*([^\s]+)?',
-                    r'initialize\s+(?:repo|repository)?\s*([^\s]+)?',
-                    r'create\s+(?:repo|repository)?\s*([^\s]+)?'
-                ],
-                'extract_args': lambda match: [match.group(1)] if match and match.group(1) else ['.']
-            },
-            
-            # Add operations
-            'add': {
-                'patterns': [
-                    r'add\s+([^\s]+)',
-                    r'stage\s+([^\s]+)',
-                    r'add\s+all',
-                    r'add\s+\.'
-                ],
-                'extract_args': lambda match: [match.group(1)] if match else ['.']
-            }
-        }
-        
         # Try to match operations
-        for op_type, op_config in operations.items():
-            for pattern in op_config['patterns']:
-                match = re.search(pattern, input_lower)
+        for op_type, patterns, extract_args in _GIT_OPERATIONS:
+            for pattern in patterns:
+                match = pattern.search(input_lower)
                 if match:
-                    args = op_config['extract_args'](match)
                     return {
                         'type': op_type,
-                        'args': args,
+                        'args': extract_args(match),
                         'raw_input': user_input,
-                        'matched_pattern': pattern
+                        'matched_pattern': pattern.pattern
                     }
         
         return None
@@ -212,7 +262,8 @@ class TerryGitTool(BaseTool):
         
         # Route to appropriate method
         if op_type == 'clone':
-            return self._handle_clone_operation(args, context)
+            shallow = 'shallow' in operation['raw_input'].lower()
+            return self._handle_clone_operation(args, context, shallow)
         elif op_type == 'commit':
             return self._handle_commit_operation(args, context)
         elif op_type == 'push':
@@ -232,7 +283,7 @@ class TerryGitTool(BaseTool):
         else:
             raise ValueError(f"Unsupported Git operation: {op_type}")
     
-    def _handle_clone_operation(self, args: List[str], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_clone_operation(self, args: List[str], context: Dict[str, Any], shallow: bool = False) -> Dict[str, Any]:
         """Handle repository cloning operation"""
         if not args:
             return {'error': 'Repository URL required for clone operation'}
@@ -242,7 +293,7 @@ class TerryGitTool(BaseTool):
         repo_name = repo_url.split('/')[-1].replace('.git', '')
         target_path = repo_name
         
-        return self.git_manager.clone_repository(repo_url, target_path)
+        return self.git_manager.clone_repository(repo_url, target_path, shallow)
     
     def _handle_commit_operation(self, args: List[str], context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle commit operation"""
@@ -305,7 +356,7 @@ class TerryGitTool(BaseTool):
         """Handle repository initialization"""
         target_path = args[0] if args else '.'
         
-        return self.git_manager.execute_git_command(f'init "{target_path}"', target_path)
+        return self.git_manager.execute_git_command(f'init "{target_path}"', target_path, capture=False)
     
     def _handle_add_operation(self, args: List[str], context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle add operation"""
@@ -314,66 +365,54 @@ class TerryGitTool(BaseTool):
         
         repo_path = context.get('current_directory', '.')
         
-        # Add each file/pattern
-        results = []
-        for file_pattern in args:
-            result = self.git_manager.execute_git_command(f'add "{file_pattern}"', repo_path)
-            results.append({
-                'file_pattern': file_pattern,
-                'result': result
-            })
+        # Stream every pattern to a single `git add` over stdin, NUL-separated,
+        # so there is one process and no command-line length limit
+        result = self._add_pathspecs(args, repo_path)
+        if result['success'] or len(args) == 1:
+            return {
+                'success': result['success'],
+                'files_added': len(args) if result['success'] else 0,
+                'details': [{'file_patterns': args, 'result': result}]
+            }
         
+        # One bad pathspec fails the whole batch and nothing is staged; add the
+        # patterns one by one so the good ones land and the bad ones are named
+        results = [
+            {'file_pattern': file_pattern, 'result': self._add_pathspecs([file_pattern], repo_path)}
+            for file_pattern in args
+        ]
         return {
-            'success': all(r['result']['success'] for r in results),
-            'files_added': len(results),
+            'success': False,
+            'files_added': sum(1 for r in results if r['result']['success']),
+            'failed_patterns': [r['file_pattern'] for r in results if not r['result']['success']],
             'details': results
         }
     
+    def _add_pathspecs(self, pathspecs: List[str], repo_path: str) -> Dict[str, Any]:
+        """Stage pathspecs with one `git add`, passing them over stdin"""
+        return self.git_manager.execute_git_command(
+            'add --pathspec-from-file=- --pathspec-file-nul',
+            repo_path,
+            input_data='\0'.join(pathspecs)
+        )
+    
     def validate_input(self, user_input: str) -> bool:
         """Validate if input is suitable for Git operations"""
         # Check for Git-related keywords
-        git_keywords = [
-            'clone', 'commit', 'push', 'pull', 'branch', 
-            'merge', 'status', 'add', 'init', 'checkout',
-            'repository', 'repo', 'git'
-        ]
-        
-        return any(keyword in user_input.lower() for keyword in git_keywords)
+        return _VALIDATE_RE.search(user_input) is not None
     
     def get_help_text(self) -> str:
         """Get help text for Git operations"""
-        return """
-🔧 Terry Git Tool - Comprehensive Git Operations
-
-📋 Supported Operations:
-• clone <url> - Clone a repository
-• commit with message "<message>" - Commit changes
-• push [remote] [branch] - Push to remote
-• pull [remote] [branch] - Pull from remote  
-• create branch <name> - Create new branch
-• merge <source> [into <target>] - Merge branches
-• status - Show repository status
-• init [path] - Initialize repository
-• add <files> - Add files to staging
-
-🌐 Platform Support:
-• Windows 10/11 with PowerShell integration
-• macOS with shell commands
-• Linux with bash commands
-• Long path support on Windows
-• Cross-platform path handling
-
-💡 Examples:
-• "clone https://github.com/user/repo.git"
-• "commit with message 'Fixed bug in login'"
-• "push to origin main"  
-• "create branch feature/new-ui"
-• "merge feature/new-ui into main"
-• "check status"
-        """.strip()
+        return _HELP_TEXT
     
     def get_status_info(self) -> Dict[str, Any]:
-        """Get current Git tool status"""
+        """Get current Git tool status (fixed for the tool's lifetime, so built once)"""
+        if self._status_info is None:
+            self._status_info = self._build_status_info()
+        return self._status_info
+    
+    def _build_status_info(self) -> Dict[str, Any]:
+        """Build the status dict returned by get_status_info"""
         return {
             'platform': self.platform,
             'platform_info': self.platform_info,
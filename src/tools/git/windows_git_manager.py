@@ -4,21 +4,99 @@ Handles Windows 10/11 compatibility with PowerShell integration and long path su
 """
 
 import os
-import platform
+import re
+import shlex
+import shutil
 import subprocess
+import threading
 import ctypes
 import logging
+from collections import deque
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
+
+from .cross_platform_git import SHALLOW_CLONE_OPTIONS, _SYSTEM, _COMMIT_SUMMARY_RE, _GitSession, _parse_porcelain_v2
+
+# Git executable found by the first WindowsGitManager; probing is done once per process
+_GIT_EXECUTABLE_CACHE: Optional[str] = None
+_GIT_EXECUTABLE_LOCK = threading.Lock()
+
+# Characters and device names Windows does not allow in path components
+_FORBIDDEN_RE = re.compile(r'[<>:"|?*]')
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    *(f'COM{i}' for i in range(1, 10)),
+    *(f'LPT{i}' for i in range(1, 10))
+})
+
+# Last path component of a repository URL (https, scp-style git@host:user/repo, or a local path)
+_REPO_NAME_RE = re.compile(r'[:/\\]([^:/\\]+?)(?:\.git)?[/\\]?$')
+
+# Keep git/PowerShell children from attaching a console window (conhost) on Windows
+_POPEN_KW = {'creationflags': subprocess.CREATE_NO_WINDOW} if _SYSTEM == "Windows" else {}
+
+# kernel32 GetShortPathNameW, bound once with explicit signatures (Windows only)
+if _SYSTEM == "Windows":
+    from ctypes import wintypes
+    
+    _GetShortPathNameW = ctypes.WinDLL('kernel32', use_last_error=True).GetShortPathNameW
+    _GetShortPathNameW.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD]
+    _GetShortPathNameW.restype = wintypes.DWORD
+else:
+    _GetShortPathNameW = None
+
+# Marks the end of one command's output from the persistent PowerShell host
+_PS_SENTINEL = '<<<END_SENTINEL>>>'
+
+# Lines of stderr kept per command; bounds memory for chatty clone progress output
+_STDERR_TAIL_LINES = 8192
+
+
+def _write_and_close(stream, data: str) -> None:
+    """Feed a child's stdin from a helper thread, ignoring an early exit"""
+    try:
+        stream.write(data)
+        stream.close()
+    except (BrokenPipeError, OSError):
+        pass
+
+
+def _config_marker_path() -> Optional[Path]:
+    """Per-machine marker recording that the global Git config was applied"""
+    local_app_data = os.getenv('LOCALAPPDATA')
+    if not local_app_data:
+        return None
+    return Path(local_app_data) / 'terry-the-tool-bot' / '.git-configured'
+
+
+def _tokenize(command: Union[str, List[str]]) -> List[str]:
+    """Git arguments from a pre-tokenized list, or from a string with shell-style quoting.
+    
+    On Windows backslashes are path separators, not escapes, so C:\\repo\\file stays intact.
+    """
+    if not isinstance(command, str):
+        return list(command)
+    if _SYSTEM != "Windows":
+        return shlex.split(command)
+    lexer = shlex.shlex(command, posix=True)
+    lexer.whitespace_split = True
+    lexer.escape = ''
+    return list(lexer)
+
 
 class WindowsGitManager:
     """Windows-specific Git operations manager"""
     
     def __init__(self):
-        self.platform = platform.system()
+        self.platform = _SYSTEM
         self.is_windows = self.platform == "Windows"
         self.git_executable = self._find_git_executable()
         self.use_powershell = self._should_use_powershell()
+        self._ps_proc = None
+        self._ps_lock = threading.Lock()
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
         
         if self.is_windows:
             self._configure_windows_git()
@@ -27,28 +105,35 @@ class WindowsGitManager:
             logging.warning(f"Not running on Windows, current platform: {self.platform}")
     
     def _find_git_executable(self) -> Optional[str]:
-        """Find Git executable on Windows"""
+        """Find Git executable on Windows (result shared across instances)"""
+        global _GIT_EXECUTABLE_CACHE
+        
         if not self.is_windows:
             return "git"
-            
-        git_paths = [
-            r"C:\Program Files\Git\cmd\git.exe",
-            r"C:\Program Files (x86)\Git\cmd\git.exe", 
-            r"C:\Program Files\Git\bin\git.exe",
-            rf"C:\Users\{os.getenv('USERNAME')}\AppData\Local\Programs\Git\cmd\git.exe"
-        ]
         
-        for path in git_paths:
-            if os.path.exists(path):
-                logging.info(f"Found Git at: {path}")
-                return path
-                
-        # Check PATH
-        try:
-            subprocess.run(["git", "--version"], check=True, capture_output=True)
-            logging.info("Git found in PATH")
-            return "git"
-        except subprocess.CalledProcessError:
+        with _GIT_EXECUTABLE_LOCK:
+            if _GIT_EXECUTABLE_CACHE is not None:
+                return _GIT_EXECUTABLE_CACHE
+            
+            git_paths = [
+                r"C:\Program Files\Git\cmd\git.exe",
+                r"C:\Program Files (x86)\Git\cmd\git.exe", 
+                r"C:\Program Files\Git\bin\git.exe",
+                rf"C:\Users\{os.getenv('USERNAME')}\AppData\Local\Programs\Git\cmd\git.exe"
+            ]
+            
+            for path in git_paths:
+                if os.path.isfile(path):
+                    logging.info(f"Found Git at: {path}")
+                    _GIT_EXECUTABLE_CACHE = path
+                    return path
+            
+            # Check PATH without spawning git
+            if shutil.which("git"):
+                logging.info("Git found in PATH")
+                _GIT_EXECUTABLE_CACHE = "git"
+                return "git"
+            
             logging.error("Git not found on system")
             return None
     
@@ -56,111 +141,250 @@ class WindowsGitManager:
         """Configure Git for Windows compatibility"""
         if not self.git_executable:
             raise Exception("Git not found on Windows")
+        
+        # Skip entirely once this machine was configured by the current version of this module
+        marker = _config_marker_path()
+        try:
+            if marker and marker.stat().st_mtime > os.path.getmtime(__file__):
+                return
+        except OSError:
+            pass
             
         windows_configs = {
             'core.autocrlf': 'true',      # Handle line endings
             'core.longpaths': 'true',      # Support long paths
             'core.symlinks': 'true',       # Enable symbolic links
             'core.filemode': 'false',      # Ignore permission bits
-            'core.protectntfs': 'false'    # Allow NTFS operations
+            'core.protectntfs': 'false',   # Allow NTFS operations
+            'core.preloadindex': 'true',   # Parallel index stat() during status/diff
+            'core.fscache': 'true'         # Cache filesystem metadata (Git for Windows)
         }
         
+        # Read the current global core.* settings once and only write keys that differ
+        current = {}
+        try:
+            result = subprocess.run([
+                self.git_executable, 'config', '--global', '--get-regexp', r'^core\.'
+            ], capture_output=True, text=True, **_POPEN_KW)
+            for line in result.stdout.splitlines():
+                name, _, current_value = line.partition(' ')
+                current[name] = current_value
+        except OSError as e:
+            logging.warning(f"Failed to read Git config: {e}")
+        
+        configured = True
         for key, value in windows_configs.items():
+            if current.get(key.lower()) == value:
+                continue
             try:
                 subprocess.run([
                     self.git_executable, 'config', '--global', key, value
-                ], check=True, capture_output=True)
+                ], check=True, capture_output=True, **_POPEN_KW)
                 logging.info(f"Configured Git: {key} = {value}")
             except subprocess.CalledProcessError as e:
                 logging.error(f"Failed to configure {key}: {e}")
+                configured = False
+        
+        if configured and marker:
+            try:
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.touch()
+            except OSError as e:
+                logging.warning(f"Failed to write Git config marker {marker}: {e}")
     
     def _should_use_powershell(self) -> bool:
-        """Determine if PowerShell should be used for Git commands"""
-        if not self.is_windows:
+        """Determine if PowerShell should be used for Git commands (opt-in via TERRY_USE_POWERSHELL=1)"""
+        if not self.is_windows or os.getenv('TERRY_USE_POWERSHELL') != '1':
             return False
             
         # Check if PowerShell 5+ is available
         try:
             result = subprocess.run([
                 'powershell', '-Command', '$PSVersionTable.PSVersion.Major'
-            ], capture_output=True, text=True, check=True)
+            ], capture_output=True, text=True, check=True, **_POPEN_KW)
             
             ps_version = int(result.stdout.strip())
             return ps_version >= 5
         except:
             return False
     
-    def execute_git_command(self, command: str, cwd: Optional[str] = None) -> Dict[str, Any]:
-        """Execute Git command using appropriate Windows method"""
-        if self.use_powershell:
-            return self._execute_via_powershell(command, cwd)
+    def execute_git_command(self, command: Union[str, List[str]], cwd: Optional[str] = None,
+                            input_data: Optional[str] = None) -> Dict[str, Any]:
+        """Execute Git command (string or argument list), calling git.exe directly unless PowerShell was opted into"""
+        args = _tokenize(command)
+        # Commands fed through stdin bypass the PowerShell wrapper
+        if self.use_powershell and input_data is None:
+            return self._execute_via_powershell(args, cwd)
         else:
-            return self._execute_directly(command, cwd)
+            return self._execute_directly_argv([self.git_executable, *args], cwd, input_data)
     
-    def _execute_via_powershell(self, command: str, cwd: Optional[str] = None) -> Dict[str, Any]:
-        """Execute Git command through PowerShell for better Windows integration"""
-        ps_script = f"""
-        try {{
-            Set-Location '{cwd or os.getcwd()}'
-            
-            # Enable progress reporting
-            $ProgressPreference = 'Continue'
-            
-            # Execute git command
-            $result = git {command}
-            
-            # Output result
-            if ($result) {{
-                Write-Output $result
-            }}
-            
-            exit 0
-        }} catch {{
-            Write-Error $_.Exception.Message
-            exit 1
-        }}
-        """
-        
-        try:
-            result = subprocess.run([
+    def _get_powershell_host(self) -> subprocess.Popen:
+        """Get (or start) the long-running PowerShell host that runs Git commands"""
+        if self._ps_proc is None or self._ps_proc.poll() is not None:
+            self._ps_proc = subprocess.Popen([
                 'powershell',
                 '-NoProfile',           # Don't load profiles
                 '-ExecutionPolicy', 'Bypass',  # Bypass execution policy
-                '-Command', ps_script
-            ], capture_output=True, text=True, cwd=cwd, timeout=60)
+                '-NoLogo',
+                '-Command', '-'         # Read commands from stdin
+            ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, encoding='utf-8', errors='replace', bufsize=1, **_POPEN_KW)
+            self._ps_proc.stdin.write('[Console]::OutputEncoding = [Text.Encoding]::UTF8\n')
+            self._ps_proc.stdin.flush()
+        return self._ps_proc
+    
+    def _execute_via_powershell(self, args: List[str], cwd: Optional[str] = None) -> Dict[str, Any]:
+        """Execute Git command through the persistent PowerShell host"""
+        location = (cwd or os.getcwd()).replace("'", "''")
+        command = ' '.join("'" + arg.replace("'", "''") + "'" for arg in args)
+        
+        # One line per command: stdout/stderr lines are tagged O:/E: on the host's stdout,
+        # followed by a sentinel line carrying git's exit code. Git gets an empty stdin
+        # so it can never consume the host's next command. If the location can't be set,
+        # git is not run (the host would still be in the previous command's directory)
+        # and the sentinel carries 'cwd' instead of an exit code.
+        ps_line = (
+            f"Set-Location -LiteralPath '{location}' -ErrorAction SilentlyContinue; "
+            f"if ($?) {{ "
+            f"foreach ($l in ($null | git {command} 2>&1)) {{ "
+            f"if ($l -is [System.Management.Automation.ErrorRecord]) {{ 'E:' + $l }} else {{ 'O:' + $l }} }}; "
+            f"'{_PS_SENTINEL} ' + $LASTEXITCODE "
+            f"}} else {{ 'E:' + $Error[0]; '{_PS_SENTINEL} cwd' }}\n"
+        )
+        
+        with self._ps_lock:
+            try:
+                process = self._get_powershell_host()
+                process.stdin.write(ps_line)
+                process.stdin.flush()
+            except OSError as e:
+                self._ps_proc = None
+                return {
+                    'success': False,
+                    'error': f'PowerShell host failed: {e}',
+                    'stdout': '',
+                    'stderr': '',
+                    'return_code': -1,
+                    'execution_method': 'PowerShell'
+                }
             
+            # Killing the host unblocks readline if git hangs
+            watchdog = threading.Timer(60, process.kill)
+            watchdog.start()
+            stdout_lines, stderr_lines = [], deque(maxlen=_STDERR_TAIL_LINES)
+            return_code = None
+            location_failed = False
+            try:
+                for line in process.stdout:
+                    if line.startswith(_PS_SENTINEL):
+                        code = line[len(_PS_SENTINEL):].strip()
+                        location_failed = code == 'cwd'
+                        return_code = int(code) if code.lstrip('-').isdigit() else (-1 if location_failed else 0)
+                        break
+                    if line.startswith('E:'):
+                        stderr_lines.append(line[2:])
+                    else:
+                        stdout_lines.append(line[2:])
+            finally:
+                watchdog.cancel()
+        
+        if return_code is None:
+            self._ps_proc = None
             return {
-                'success': result.returncode == 0,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'return_code': result.returncode,
+                'success': False,
+                'error': 'Command timeout',
+                'stdout': '',
+                'stderr': '',
+                'return_code': -1,
                 'execution_method': 'PowerShell'
             }
-        except subprocess.TimeoutExpired:
+        
+        if location_failed:
             return {
                 'success': False,
-                'error': 'Command timeout',
+                'error': f'Invalid working directory: {cwd or os.getcwd()}',
                 'stdout': '',
-                'stderr': '',
+                'stderr': ''.join(stderr_lines),
                 'return_code': -1,
                 'execution_method': 'PowerShell'
             }
+        
+        return {
+            'success': return_code == 0,
+            'stdout': ''.join(stdout_lines),
+            'stderr': ''.join(stderr_lines),
+            'return_code': return_code,
+            'execution_method': 'PowerShell'
+        }
+    
+    def _get_session(self, repo_path: str) -> _GitSession:
+        """Get (or start) the persistent git session for a repository"""
+        key = os.path.abspath(repo_path)
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session is None or not session.alive:
+                session = _GitSession(self.git_executable, key, **_POPEN_KW)
+                self._sessions[key] = session
+            return session
     
-    def _execute_directly(self, command: str, cwd: Optional[str] = None) -> Dict[str, Any]:
+    def close(self) -> None:
+        """Stop the PowerShell host and git sessions"""
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+        with self._ps_lock:
+            if self._ps_proc is not None and self._ps_proc.poll() is None:
+                try:
+                    self._ps_proc.stdin.close()
+                    self._ps_proc.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._ps_proc.kill()
+            self._ps_proc = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _execute_directly(self, command: Union[str, List[str]], cwd: Optional[str] = None,
+                          input_data: Optional[str] = None) -> Dict[str, Any]:
         """Execute Git command directly"""
+        return self._execute_directly_argv([self.git_executable, *_tokenize(command)], cwd, input_data)
+    
+    def _execute_directly_argv(self, argv: List[str], cwd: Optional[str] = None,
+                               input_data: Optional[str] = None) -> Dict[str, Any]:
+        """Execute a pre-tokenized Git argv directly (no re-splitting or quoting)"""
+        process = subprocess.Popen(
+            argv,
+            stdin=subprocess.PIPE if input_data is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=cwd,
+            **_POPEN_KW
+        )
+        
+        # stdout is kept whole (callers parse it); stderr carries clone/fetch progress,
+        # so only its tail is kept. Text mode splits progress updates on '\r'.
+        stdout_chunks = []
+        stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+        drains = [
+            threading.Thread(target=lambda: stdout_chunks.append(process.stdout.read()), daemon=True),
+            threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+        ]
+        if input_data is not None:
+            drains.append(threading.Thread(target=_write_and_close, args=(process.stdin, input_data), daemon=True))
+        for drain in drains:
+            drain.start()
+        
         try:
-            result = subprocess.run([
-                self.git_executable
-            ] + command.split(), capture_output=True, text=True, cwd=cwd, timeout=60)
-            
-            return {
-                'success': result.returncode == 0,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'return_code': result.returncode,
-                'execution_method': 'Direct'
-            }
+            process.wait(timeout=60)
         except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
             return {
                 'success': False,
                 'error': 'Command timeout',
@@ -169,32 +393,41 @@ class WindowsGitManager:
                 'return_code': -1,
                 'execution_method': 'Direct'
             }
+        finally:
+            for drain in drains:
+                drain.join(timeout=5)
+            process.stdout.close()
+            process.stderr.close()
+        
+        return {
+            'success': process.returncode == 0,
+            'stdout': ''.join(stdout_chunks),
+            'stderr': ''.join(stderr_tail),
+            'return_code': process.returncode,
+            'execution_method': 'Direct'
+        }
     
     def handle_windows_paths(self, path: str) -> str:
         """Handle Windows-specific path issues"""
-        if not self.is_windows:
+        # Short paths need no handling; Git for Windows accepts either separator
+        if not self.is_windows or len(path) <= 260:
             return path
-            
-        # Convert to Path object for proper handling
-        path_obj = Path(path)
         
-        # Normalize path separators
-        normalized_path = str(path_obj)
-        
-        # Handle long paths (>260 characters)
-        if len(normalized_path) > 260:
-            # Use Windows extended-length path syntax
-            absolute_path = path_obj.absolute()
-            return f"\\\\?\\{absolute_path}"
-            
-        return normalized_path
+        # Handle long paths (>260 characters) with Windows extended-length path syntax
+        absolute_path = Path(path).absolute()
+        return f"\\\\?\\{absolute_path}"
     
     def get_windows_short_path(self, long_path: str) -> str:
         """Get Windows short path name for long paths"""
+        if _GetShortPathNameW is None:
+            return long_path
         try:
-            buffer = ctypes.create_unicode_buffer(260)
-            result = ctypes.windll.kernel32.GetShortPathNameW(long_path, buffer, 260)
-            if result:
+            # First call reports the required buffer size (including the terminator)
+            size = _GetShortPathNameW(long_path, None, 0)
+            if size:
+                buffer = ctypes.create_unicode_buffer(size)
+                result = _GetShortPathNameW(long_path, buffer, size)
+            if size and 0 < result < size:
                 short_path = buffer.value
                 logging.info(f"Converted long path to short path: {short_path}")
                 return short_path
@@ -204,6 +437,10 @@ class WindowsGitManager:
     
     def validate_repository_path(self, repo_path: str) -> Dict[str, Any]:
         """Validate repository path for Windows compatibility"""
+        return self.validate_existing_repo_path(repo_path)
+    
+    def validate_existing_repo_path(self, repo_path: str) -> Dict[str, Any]:
+        """Validate an existing repository path for Windows compatibility"""
         try:
             path_obj = Path(repo_path)
             
@@ -215,34 +452,37 @@ class WindowsGitManager:
                     'suggestions': ['Create the directory', 'Check path spelling']
                 }
             
-            # Check for Windows path issues
-            issues = []
+            return self._check_path_issues(repo_path, path_obj)
             
-            # Check for forbidden characters
-            forbidden_chars = ['<', '>', ':', '"', '|', '?', '*']
-            if any(char in repo_path for char in forbidden_chars):
-                issues.append('Contains forbidden characters')
+        except Exception as e:
+            return {
+                'valid': False,
+                'error': f'Path validation failed: {str(e)}'
+            }
+    
+    def validate_new_repo_target(self, target_path: str) -> Dict[str, Any]:
+        """Validate a clone target: its parent must exist and it must be absent or an empty directory"""
+        try:
+            path_obj = Path(target_path)
             
-            # Check path length
-            if len(str(path_obj.absolute())) > 260:
-                issues.append('Path exceeds 260 characters')
+            # Check the parent exists (a clone target itself normally doesn't yet)
+            parent = path_obj.absolute().parent
+            if not parent.is_dir():
+                return {
+                    'valid': False,
+                    'error': f'Parent directory does not exist: {parent}',
+                    'suggestions': ['Create the parent directory', 'Check path spelling']
+                }
             
-            # Check for reserved names
-            reserved_names = ['CON', 'PRN', 'AUX', 'NUL'] + [f'COM{i}' for i in range(1, 10)] + [f'LPT{i}' for i in range(1, 10)]
-            path_parts = path_obj.parts
-            if any(part in reserved_names for part in path_parts):
-                issues.append('Contains reserved name')
+            # Git only clones into a missing path or an empty directory
+            if path_obj.exists() and (not path_obj.is_dir() or any(path_obj.iterdir())):
+                return {
+                    'valid': False,
+                    'error': f'Target already exists and is not an empty directory: {target_path}',
+                    'suggestions': ['Choose a new directory name', 'Remove the existing directory']
+                }
             
-            return {
-                'valid': len(issues) == 0,
-                'issues': issues,
-                'path': str(path_obj.absolute()),
-                'suggestions': [
-                    'Use shorter path names',
-                    'Avoid special characters',
-                    'Use subst to map long paths'
-                ] if issues else []
-            }
+            return self._check_path_issues(target_path, path_obj)
             
         except Exception as e:
             return {
@@ -250,11 +490,39 @@ class WindowsGitManager:
                 'error': f'Path validation failed: {str(e)}'
             }
     
-    def clone_repository(self, repo_url: str, target_path: str) -> Dict[str, Any]:
+    def _check_path_issues(self, repo_path: str, path_obj: Path) -> Dict[str, Any]:
+        """Check a path for forbidden characters, excessive length and reserved names"""
+        issues = []
+        
+        # Check for forbidden characters (the drive letter's colon is allowed)
+        if _FORBIDDEN_RE.search(os.path.splitdrive(repo_path)[1]):
+            issues.append('Contains forbidden characters')
+        
+        # Check path length
+        abs_str = str(path_obj.absolute())
+        if len(abs_str) > 260:
+            issues.append('Path exceeds 260 characters')
+        
+        # Check for reserved names (NTFS names are case-insensitive)
+        if not _RESERVED_NAMES.isdisjoint(part.upper() for part in path_obj.parts):
+            issues.append('Contains reserved name')
+        
+        return {
+            'valid': len(issues) == 0,
+            'issues': issues,
+            'path': abs_str,
+            'suggestions': [
+                'Use shorter path names',
+                'Avoid special characters',
+                'Use subst to map long paths'
+            ] if issues else []
+        }
+    
+    def clone_repository(self, repo_url: str, target_path: str, shallow: bool = False) -> Dict[str, Any]:
         """Clone repository with Windows path handling"""
         try:
             # Validate target path
-            path_validation = self.validate_repository_path(target_path)
+            path_validation = self.validate_new_repo_target(target_path)
             if not path_validation['valid']:
                 return {
                     'success': False,
@@ -267,10 +535,12 @@ class WindowsGitManager:
             
             logging.info(f"Cloning repository {repo_url} to {clone_path}")
             
-            result = self.execute_git_command(f'clone {repo_url} "{clone_path}"')
+            options = SHALLOW_CLONE_OPTIONS.split() if shallow else []
+            result = self.execute_git_command(['clone', *options, repo_url, clone_path])
             
             if result['success']:
-                repo_name = repo_url.split('/')[-1].replace('.git', '')
+                match = _REPO_NAME_RE.search(repo_url)
+                repo_name = match.group(1) if match else repo_url
                 return {
                     'success': True,
                     'repository_path': clone_path,
@@ -295,22 +565,17 @@ class WindowsGitManager:
     def get_status(self, repo_path: str = '.') -> Dict[str, Any]:
         """Get Git status with Windows compatibility"""
         try:
-            # Change to repository directory
-            original_cwd = os.getcwd()
-            os.chdir(repo_path)
-            
-            result = self.execute_git_command('status --porcelain=v2')
-            
-            # Restore original directory
-            os.chdir(original_cwd)
+            # Read-only snapshot: skip the index refresh that takes index.lock
+            result = self.execute_git_command(['--no-optional-locks', 'status', '--porcelain=v2'], cwd=repo_path)
             
             if result['success']:
                 return {
                     'success': True,
                     'status': result['stdout'],
+                    **_parse_porcelain_v2(result['stdout']),
                     'repo_path': repo_path,
                     'execution_method': result.get('execution_method'),
-                    'timestamp': subprocess.run(['date'], capture_output=True, text=True).stdout.strip()
+                    'timestamp': datetime.now(timezone.utc).isoformat()
                 }
             else:
                 return {
@@ -329,40 +594,33 @@ class WindowsGitManager:
     def commit_changes(self, message: str, files: Optional[List[str]] = None, repo_path: str = '.') -> Dict[str, Any]:
         """Commit changes with platform-specific handling"""
         try:
-            # Change to repository directory
-            original_cwd = os.getcwd()
-            os.chdir(repo_path)
-            
-            # Add files
+            # Add files (all patterns in one invocation)
             if files:
-                for file_pattern in files:
-                    add_result = self.execute_git_command(f'add "{file_pattern}"')
-                    if not add_result['success']:
-                        os.chdir(original_cwd)
-                        return {
-                            'success': False,
-                            'error': f'Failed to add files: {add_result.get("stderr")}'
-                        }
+                add_result = self._execute_directly_argv(
+                    [self.git_executable, 'add', '--', *files], cwd=repo_path
+                )
+                if not add_result['success']:
+                    return {
+                        'success': False,
+                        'error': f'Failed to add files: {add_result.get("stderr")}'
+                    }
             else:
                 # Add all changes
-                add_result = self.execute_git_command('add -A')
+                add_result = self.execute_git_command(['add', '-A'], cwd=repo_path)
                 if not add_result['success']:
-                    os.chdir(original_cwd)
                     return {
                         'success': False,
                         'error': f'Failed to add all files: {add_result.get("stderr")}'
                     }
             
             # Create commit
-            commit_result = self.execute_git_command(f'commit -m "{message}"')
-            
-            # Restore original directory
-            os.chdir(original_cwd)
+            commit_result = self.execute_git_command(['commit', '-m', message], cwd=repo_path)
             
             if commit_result['success']:
-                # Get commit hash
-                hash_result = self.execute_git_command('rev-parse HEAD')
-                commit_hash = hash_result.get('stdout', '').strip() if hash_result['success'] else 'unknown'
+                # Expand the short hash git printed (falls back to HEAD) via the persistent session
+                match = _COMMIT_SUMMARY_RE.match(commit_result.get('stdout', ''))
+                revision = match.group(1) if match else 'HEAD'
+                commit_hash = self._get_session(repo_path).resolve(revision) or 'unknown'
                 
                 return {
                     'success': True,
@@ -370,7 +628,7 @@ class WindowsGitManager:
                     'commit_message': message,
                     'repo_path': repo_path,
                     'execution_method': commit_result.get('execution_method'),
-                    'timestamp': subprocess.run(['date'], capture_output=True, text=True).stdout.strip()
+                    'timestamp': datetime.now(timezone.utc).isoformat()
                 }
             else:
                 return {
@@ -3,14 +3,340 @@ GitHub API Client - Windows-compatible GitHub API integration
 Provides comprehensive GitHub API operations with Windows-specific optimizations
 """
 
+import asyncio
+import binascii
+import copy
+import functools
+import hashlib
 import os
+import re
 import platform
+import sqlite3
 import subprocess
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs, quote, urlencode
+from typing import Dict, Any, Mapping, Optional, List, Union
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+# Fastest available JSON codec; all three accept bytes in loads()
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
+# Optional: only needed by AsyncGitHubAPIClient
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Connection pool shared by every GitHubAPIClient, so TLS connections to the API are
+# reused across instances. Transient 5xx responses on GET/HEAD/DELETE are retried
+# with backoff; PUT is not, since a contents PUT creates a commit. Rate limits
+# (403/429) are left to _make_request, which caps how long it waits.
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD', 'DELETE']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
+
+_DEFAULT_HEADERS = {
+    'Accept': 'application/vnd.github.v3+json',
+    'User-Agent': 'Terry-the-Tool-Bot/1.0.0',
+    'X-GitHub-Api-Version': '2022-11-28',
+    'Content-Type': 'application/json'  # Bodies are pre-serialized before sending
+}
+
+
+# Conditional-GET cache: entries kept per client, and how long an entry is served
+# without revalidating (0 = always revalidate; GitHub doesn't bill 304 responses)
+_CACHE_MAX_ENTRIES = 256
+_USER_CACHE_TTL = 300.0
+
+
+def _cache_ttl(endpoint: str) -> float:
+    """Seconds a cached GET of endpoint may be reused without a request"""
+    # User profiles change rarely; everything else is revalidated with its ETag
+    if endpoint == 'user' or (endpoint.startswith('users/') and '/' not in endpoint[6:]):
+        return _USER_CACHE_TTL
+    return 0.0
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a cached GET result, so callers can't change what later hits return"""
+    return {
+        **result,
+        'data': copy.deepcopy(result['data']),
+        'headers': CaseInsensitiveDict(result['headers'])
+    }
+
+
+# Persistent store behind the conditional-GET cache, so a new process revalidates
+# instead of refetching. Off unless TERRY_GITHUB_CACHE names the sqlite file; the
+# bodies are authenticated responses, so the file is readable by its owner only.
+_DISK_CACHE_ENV = 'TERRY_GITHUB_CACHE'
+_DISK_CACHE_MAX_AGE = 30 * 24 * 3600.0  # entries not revalidated for this long are dropped
+_DISK_LOCK = threading.Lock()  # guards every connection returned by _open_disk_cache
+
+
+@functools.lru_cache(maxsize=None)
+def _open_disk_cache(path: str) -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the on-disk GET cache once per process; None if unusable"""
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        # Create the file private before sqlite opens it; tighten one left by an older run
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(path, 0o600)
+        conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache(key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+            'headers BLOB, body BLOB, raw INTEGER, fetched REAL)'
+        )
+        conn.execute('DELETE FROM cache WHERE fetched < ?', (time.time() - _DISK_CACHE_MAX_AGE,))
+        conn.commit()
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        logging.warning(f"GitHub disk cache unavailable at {path}: {e}")
+        return None
+
+
+# Pre-flight throttling: pause when fewer requests than this remain in the window,
+# and never sleep longer than the cap (for the reset wait or a Retry-After)
+_RATE_LIMIT_FLOOR = 10
+_RATE_LIMIT_MAX_WAIT = 60.0
+
+
+# Failed responses: only JSON bodies up to this size are parsed for GitHub's message
+# (5xx/CDN failures can be large HTML pages), and response_text is truncated
+_ERROR_BODY_LIMIT = 8192
+_ERROR_TEXT_LIMIT = 512
+
+
+def _error_message(body: bytes, content_type: str) -> str:
+    """GitHub's error message from a failed response body"""
+    if body and 'json' in content_type and len(body) <= _ERROR_BODY_LIMIT:
+        try:
+            return _json.loads(body).get('message', 'Unknown API error')
+        except (ValueError, AttributeError):
+            pass
+    return 'Unknown API error'
+
+
+# Endpoint templates. Owner, repository and user names are percent-encoded as single
+# segments, file paths keep their '/', so names with spaces, '#' or '?' stay intact
+_REPO_TEMPLATE = 'repos/{}/{}'.format
+_CONTENTS_TEMPLATE = 'repos/{}/{}/contents/{}'.format
+_USER_TEMPLATE = 'users/{}'.format
+
+
+def _repo_endpoint(owner: str, repo_name: str) -> str:
+    """Endpoint of a repository: repos/{owner}/{repo}"""
+    return _REPO_TEMPLATE(quote(owner, safe=''), quote(repo_name, safe=''))
+
+
+def _contents_endpoint(owner: str, repo_name: str, path: str) -> str:
+    """Endpoint of a file or directory in a repository"""
+    return _CONTENTS_TEMPLATE(quote(owner, safe=''), quote(repo_name, safe=''), quote(path, safe='/'))
+
+
+def _user_endpoint(username: str) -> str:
+    """Endpoint of a user profile: users/{username}"""
+    return _USER_TEMPLATE(quote(username, safe=''))
+
+
+@functools.lru_cache(maxsize=128)
+def _request_url(base_url: str, endpoint: str, query: tuple) -> str:
+    """Full request URL, with the query string encoded once per distinct request"""
+    url = f"{base_url}/{endpoint}"
+    return f"{url}?{urlencode(query)}" if query else url
+
+
+def _query_key(params: Optional[Dict]) -> tuple:
+    """Hashable, order-independent form of request params; None values are dropped"""
+    if not params:
+        return ()
+    return tuple(sorted((key, value) for key, value in params.items() if value is not None))
+
+
+# Pagination: `Link: <url?page=2>; rel="next", <url?page=5>; rel="last"`
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="(\w+)"')
+_PAGE_WORKERS = 32  # matches the shared adapter's pool size
+
+
+def _link_pages(headers: Mapping[str, str]) -> Dict[str, int]:
+    """Page numbers by rel ("next", "last", ...) from a response's Link header"""
+    pages = {}
+    for url, rel in _LINK_RE.findall(headers.get('Link') or ''):
+        page = parse_qs(urlparse(url).query).get('page')
+        if page and page[0].isdigit():
+            pages[rel] = int(page[0])
+    return pages
+
+
+# Output fields as (key, GitHub field) pairs, projected from API records in one pass
+_REPO_LIST_FIELDS = (
+    ('name', 'name'),
+    ('full_name', 'full_name'),
+    ('description', 'description'),
+    ('clone_url', 'clone_url'),
+    ('ssh_url', 'ssh_url'),
+    ('html_url', 'html_url'),
+    ('private', 'private'),
+    ('language', 'language'),
+    ('stars', 'stargazers_count'),
+    ('forks', 'forks_count'),
+    ('open_issues', 'open_issues_count'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at')
+)
+_REPO_INFO_FIELDS = _REPO_LIST_FIELDS[:7] + (('default_branch', 'default_branch'),) + _REPO_LIST_FIELDS[7:]
+_SEARCH_REPO_FIELDS = _REPO_LIST_FIELDS[:4] + (('html_url', 'html_url'),) + _REPO_LIST_FIELDS[7:]
+
+
+def _project(record: Dict[str, Any], fields) -> Dict[str, Any]:
+    """Pick and rename fields of an API record"""
+    get = record.get
+    return {key: get(source) for key, source in fields}
+
+
+def _repository_info(repo_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Repository fields returned by get_repository"""
+    return _project(repo_data, _REPO_INFO_FIELDS)
+
+
+def _repository_list_entry(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """Repository fields returned per entry by list_repositories"""
+    return _project(repo, _REPO_LIST_FIELDS)
+
+
+# GraphQL: repository fields fetched per alias, and aliases packed into one query
+_GRAPHQL_REPO_FIELDS = (
+    'name nameWithOwner description url sshUrl isPrivate defaultBranchRef { name } '
+    'primaryLanguage { name } stargazerCount forkCount issues(states: OPEN) { totalCount } '
+    'createdAt updatedAt'
+)
+_GRAPHQL_BATCH_SIZE = 100
+
+
+def _graphql_repository_info(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL repository node onto the fields returned by get_repository"""
+    return {
+        'name': node.get('name'),
+        'full_name': node.get('nameWithOwner'),
+        'description': node.get('description'),
+        'clone_url': f"{node['url']}.git" if node.get('url') else None,
+        'ssh_url': node.get('sshUrl'),
+        'html_url': node.get('url'),
+        'private': node.get('isPrivate'),
+        'default_branch': (node.get('defaultBranchRef') or {}).get('name'),
+        'language': (node.get('primaryLanguage') or {}).get('name'),
+        'stars': node.get('stargazerCount'),
+        'forks': node.get('forkCount'),
+        'open_issues': (node.get('issues') or {}).get('totalCount'),
+        'created_at': node.get('createdAt'),
+        'updated_at': node.get('updatedAt')
+    }
+
+
+# Media type that makes the contents API return the file's bytes instead of base64 JSON
+_RAW_ACCEPT = 'application/vnd.github.raw'
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _file_info(file_data: Dict[str, Any]) -> Dict[str, Any]:
+    """File fields returned by get_file_content, with base64 content decoded"""
+    # Handle content encoding
+    content = file_data.get('content', '')
+    if file_data.get('encoding') == 'base64':
+        try:
+            content = binascii.a2b_base64(content.encode('ascii')).decode('utf-8')
+        except Exception as e:
+            logging.warning(f"Failed to decode base64 content: {e}")
+            content = ''
+    
+    return {
+        'name': file_data.get('name'),
+        'path': file_data.get('path'),
+        'size': file_data.get('size'),
+        'encoding': file_data.get('encoding'),
+        'content': content,
+        'sha': file_data.get('sha'),
+        'download_url': file_data.get('download_url')
+    }
+
+
+# Help text returned by GitHubAPIClient.get_help_text
+_HELP_TEXT = """
+🐙 GitHub API Client for Terry-the-Tool-Bot
+Windows 10/11 optimized with comprehensive GitHub integration
+
+📋 Supported Operations:
+• create-repo <name> - Create new repository
+• get-repo <owner>/<repo> - Get repository info
+• list-repos [user] - List repositories
+• create-issue <owner>/<repo> <title> - Create issue
+• create-pr <owner>/<repo> <title> - Create pull request
+• get-file <owner>/<repo>/<path> - Get file content
+• update-file <owner>/<repo>/<path> - Update file
+• get-user [username] - Get user info
+• search-repos <query> - Search repositories
+• rate-limit - Get API rate limit info
+• status - Get GitHub status
+
+⚙️ Features:
+• Windows-optimized requests
+• Token authentication
+• Rate limiting awareness
+• Error handling and retries
+• Base64 content encoding/decoding
+• Comprehensive data parsing
+• Persistent ETag cache (TERRY_GITHUB_CACHE sets the path, empty disables)
+
+🔑 Authentication:
+• Set GITHUB_TOKEN environment variable
+• Or provide token during initialization
+• Public operations work without token
+
+💡 Examples:
+• create-repo my-awesome-project
+• get-repo microsoft/vscode
+• list-repos octocat
+• create-issue myuser/myrepo "Bug in login"
+• create-pr myuser/myrepo "Fix login bug" feature/main
+• get-file microsoft/vscode/README.md
+• update-file myuser/myrepo/config.json
+• get-user torvalds
+• search-repos "machine learning python"
+• rate-limit
+• status
+
+🛠️ Windows Integration:
+• Native Windows path handling
+• Registry-based GitHub Desktop detection
+• PowerShell command compatibility
+• Long path support (>260 characters)
+• Windows-specific optimizations
+""".strip()
+
 
 class GitHubAPIClient:
     """GitHub API client with Windows compatibility"""
@@ -20,13 +346,19 @@ class GitHubAPIClient:
         self.base_url = "https://api.github.com"
         self.platform = platform.system()
         self.session = requests.Session()
+        self.session.mount(self.base_url, _ADAPTER)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()  # pages are fetched from worker threads
+        self._rate_state = {'remaining': None, 'reset': 0}
+        cache_path = os.getenv(_DISK_CACHE_ENV)
+        self._disk_cache = _open_disk_cache(os.path.expanduser(cache_path)) if cache_path else None
+        # Responses depend on who asked, so each token gets its own disk entries
+        self._disk_key_prefix = (
+            hashlib.sha256(self.token.encode('utf-8')).hexdigest()[:16] if self.token else 'anonymous'
+        )
         
         # Set up headers
-        self.session.headers.update({
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'Terry-the-Tool-Bot/1.0.0',
-            'X-GitHub-Api-Version': '2022-11-28'
-        })
+        self.session.headers.update(_DEFAULT_HEADERS)
         
         # Add authentication token if available
         if self.token:
@@ -35,33 +367,56 @@ class GitHubAPIClient:
         logging.info(f"Initialized GitHub API client for {self.platform}")
     
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                      params: Optional[Dict] = None) -> Dict[str, Any]:
+                      params: Optional[Dict] = None, extra_headers: Optional[Dict] = None) -> Dict[str, Any]:
         """Make API request with error handling"""
-        url = f"{self.base_url}/{endpoint}"
+        url = _request_url(self.base_url, endpoint, _query_key(params))
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                timeout=30
-            )
+            body = _json.dumps(data) if data is not None else None
+            for attempt in range(2):
+                self._throttle()
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    data=body,
+                    headers=extra_headers,
+                    timeout=30
+                )
+                self._update_rate_state(response.headers)
+                
+                # Secondary rate limits answer 403/429 with Retry-After; wait once and retry
+                retry_after = response.headers.get('Retry-After')
+                if attempt or response.status_code not in (403, 429) or not retry_after:
+                    break
+                try:
+                    delay = min(float(retry_after), _RATE_LIMIT_MAX_WAIT)
+                except ValueError:
+                    break
+                logging.warning(f"Rate limited on {endpoint}, retrying in {delay:.0f}s")
+                time.sleep(delay)
             
-            if response.status_code == 200:
+            if response.status_code in (200, 201):
+                if extra_headers and extra_headers.get('Accept') == _RAW_ACCEPT:
+                    # Raw media type: the body is the file itself, not JSON
+                    return {
+                        'success': True,
+                        'data': None,
+                        'raw_bytes': response.content,
+                        'status_code': response.status_code,
+                        'headers': response.headers
+                    }
                 return {
                     'success': True,
-                    'data': response.json(),
+                    'data': _json.loads(response.content),
                     'status_code': response.status_code,
-                    'headers': dict(response.headers)
+                    'headers': response.headers
                 }
             else:
-                error_data = response.json() if response.content else {}
                 return {
                     'success': False,
-                    'error': error_data.get('message', 'Unknown API error'),
+                    'error': _error_message(response.content, response.headers.get('Content-Type', '')),
                     'status_code': response.status_code,
-                    'response_text': response.text
+                    'response_text': response.content[:_ERROR_TEXT_LIMIT].decode('utf-8', errors='replace')
                 }
                 
         except requests.exceptions.Timeout:
@@ -83,6 +438,197 @@ class GitHubAPIClient:
                 'status_code': -3
             }
     
+    def _update_rate_state(self, headers) -> None:
+        """Remember the rate-limit budget reported by the last response"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            self._rate_state = {
+                'remaining': int(remaining),
+                'reset': int(headers.get('X-RateLimit-Reset', 0))
+            }
+    
+    def _throttle(self) -> None:
+        """Sleep until the rate-limit window resets when the budget is nearly spent"""
+        remaining = self._rate_state['remaining']
+        if remaining is None or remaining >= _RATE_LIMIT_FLOOR:
+            return
+        wait = self._rate_state['reset'] - time.time()
+        if wait > 0:
+            wait = min(wait, _RATE_LIMIT_MAX_WAIT)
+            logging.warning(f"GitHub rate limit nearly exhausted ({remaining} left), pausing {wait:.0f}s")
+            time.sleep(wait)
+    
+    def _cached_get(self, endpoint: str, params: Optional[Dict] = None,
+                    extra_headers: Optional[Dict] = None) -> Dict[str, Any]:
+        """GET with an ETag/Last-Modified cache; a 304 reuses the stored result"""
+        key = (
+            endpoint,
+            tuple(sorted(params.items())) if params else (),
+            tuple(sorted(extra_headers.items())) if extra_headers else ()
+        )
+        ttl = _cache_ttl(endpoint)
+        now = time.time()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is None:
+            entry = self._load_disk_entry(key, ttl)
+            if entry is not None:
+                with self._cache_lock:
+                    self._cache[key] = entry
+        
+        if entry is None:
+            result = self._make_request('GET', endpoint, params=params, extra_headers=extra_headers)
+        elif now < entry['expires_at']:
+            with self._cache_lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+            return _copy_result(entry['result'])
+        else:
+            validators = dict(extra_headers or {})
+            if entry['etag']:
+                validators['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                validators['If-Modified-Since'] = entry['last_modified']
+            result = self._make_request('GET', endpoint, params=params, extra_headers=validators)
+            if result['status_code'] == 304:
+                entry['expires_at'] = now + ttl
+                with self._cache_lock:
+                    self._cache[key] = entry
+                    self._cache.move_to_end(key)
+                self._touch_disk_entry(key, now)
+                return _copy_result(entry['result'])
+        
+        if result['success']:
+            etag = result['headers'].get('ETag')
+            last_modified = result['headers'].get('Last-Modified')
+            if etag or last_modified or ttl:
+                entry = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'result': result,
+                    'expires_at': now + ttl
+                }
+                with self._cache_lock:
+                    self._cache[key] = entry
+                    self._cache.move_to_end(key)
+                    if len(self._cache) > _CACHE_MAX_ENTRIES:
+                        self._cache.popitem(last=False)
+                self._store_disk_entry(key, entry, now)
+                return _copy_result(result)
+        return result
+    
+    def _disk_key(self, key: tuple) -> str:
+        """Row key of a cache entry, scoped to this client's token and API host"""
+        return f"{self._disk_key_prefix} {self.base_url} {key!r}"
+    
+    def _load_disk_entry(self, key: tuple, ttl: float) -> Optional[Dict[str, Any]]:
+        """Rebuild a cache entry stored on disk by an earlier process"""
+        if self._disk_cache is None:
+            return None
+        try:
+            with _DISK_LOCK:
+                row = self._disk_cache.execute(
+                    'SELECT etag, last_modified, headers, body, raw, fetched FROM cache WHERE key = ?',
+                    (self._disk_key(key),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"GitHub disk cache read failed: {e}")
+            return None
+        if row is None or row[4]:
+            # Raw blobs written by older versions are ignored and refetched
+            return None
+        
+        etag, last_modified, headers, body, _, fetched = row
+        result = {
+            'success': True,
+            'data': _json.loads(body),
+            'status_code': 200,
+            'headers': CaseInsensitiveDict(_json.loads(headers))
+        }
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'result': result,
+            'expires_at': fetched + ttl
+        }
+    
+    def _store_disk_entry(self, key: tuple, entry: Dict[str, Any], fetched: float) -> None:
+        """Persist a cache entry so later processes can revalidate it"""
+        if self._disk_cache is None:
+            return
+        result = entry['result']
+        if 'raw_bytes' in result:
+            # Raw file blobs can be large; they stay in memory only
+            return
+        try:
+            with _DISK_LOCK:
+                self._disk_cache.execute(
+                    'INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (self._disk_key(key), entry['etag'], entry['last_modified'],
+                     _json.dumps(dict(result['headers'])), _json.dumps(result['data']), 0, fetched)
+                )
+                self._disk_cache.commit()
+        except sqlite3.Error as e:
+            logging.warning(f"GitHub disk cache write failed: {e}")
+    
+    def _touch_disk_entry(self, key: tuple, fetched: float) -> None:
+        """Record that a disk entry was just revalidated (304)"""
+        if self._disk_cache is None:
+            return
+        try:
+            with _DISK_LOCK:
+                self._disk_cache.execute(
+                    'UPDATE cache SET fetched = ? WHERE key = ?', (fetched, self._disk_key(key))
+                )
+                self._disk_cache.commit()
+        except sqlite3.Error as e:
+            logging.warning(f"GitHub disk cache write failed: {e}")
+    
+    def _iter_pages(self, endpoint: str, params: Dict, first: Optional[Dict] = None):
+        """Yield page results one at a time by following rel="next" links"""
+        result = first or self._cached_get(endpoint, params)
+        while True:
+            yield result
+            if not result['success']:
+                return
+            next_page = _link_pages(result['headers']).get('next')
+            if next_page is None:
+                return
+            result = self._cached_get(endpoint, {**params, 'page': next_page})
+    
+    def _fetch_all_pages(self, endpoint: str, params: Dict, first: Optional[Dict] = None,
+                         sequential: bool = False) -> Dict[str, Any]:
+        """Fetch every page of a listing; pages 2..last are requested concurrently.
+        
+        first is page 1 when the caller already has it. The page count comes from its
+        rel="last" link; sequential=True (or no "last" link) follows the "next" chain
+        one request at a time instead. On success the result carries the decoded pages
+        in order under 'pages'; otherwise the first failure.
+        """
+        first = first or self._cached_get(endpoint, params)
+        if not first['success']:
+            return first
+        
+        links = _link_pages(first['headers'])
+        last_page = links.get('last')
+        if 'next' in links and (sequential or last_page is None):
+            results = list(self._iter_pages(endpoint, params, first))
+            failed = next((result for result in results if not result['success']), None)
+            return failed or {**first, 'pages': [result['data'] for result in results]}
+        
+        pages = [first['data']]
+        if last_page and last_page > 1:
+            with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, last_page - 1)) as pool:
+                results = list(pool.map(
+                    lambda page: self._cached_get(endpoint, {**params, 'page': page}),
+                    range(2, last_page + 1)
+                ))
+            for result in results:
+                if not result['success']:
+                    return result
+                pages.append(result['data'])
+        return {**first, 'pages': pages}
+    
     def create_repository(self, name: str, description: str = '', private: bool = False,
                         auto_init: bool = True) -> Dict[str, Any]:
         """Create a new repository"""
@@ -119,31 +665,15 @@ class GitHubAPIClient:
     
     def get_repository(self, owner: str, repo_name: str) -> Dict[str, Any]:
         """Get repository information"""
-        endpoint = f"repos/{owner}/{repo_name}"
+        endpoint = _repo_endpoint(owner, repo_name)
         
         logging.info(f"Fetching repository: {owner}/{repo_name}")
-        result = self._make_request('GET', endpoint)
+        result = self._cached_get(endpoint)
         
         if result['success']:
-            repo_data = result['data']
             return {
                 'success': True,
-                'repository': {
-                    'name': repo_data.get('name'),
-                    'full_name': repo_data.get('full_name'),
-                    'description': repo_data.get('description'),
-                    'clone_url': repo_data.get('clone_url'),
-                    'ssh_url': repo_data.get('ssh_url'),
-                    'html_url': repo_data.get('html_url'),
-                    'private': repo_data.get('private'),
-                    'default_branch': repo_data.get('default_branch'),
-                    'language': repo_data.get('language'),
-                    'stars': repo_data.get('stargazers_count'),
-                    'forks': repo_data.get('forks_count'),
-                    'open_issues': repo_data.get('open_issues_count'),
-                    'created_at': repo_data.get('created_at'),
-                    'updated_at': repo_data.get('updated_at')
-                },
+                'repository': _repository_info(result['data']),
                 'platform': self.platform
             }
         else:
@@ -152,7 +682,7 @@ class GitHubAPIClient:
     
     def list_repositories(self, user: Optional[str] = None, repo_type: str = 'all',
                         sort: str = 'updated', direction: str = 'desc') -> Dict[str, Any]:
-        """List user repositories"""
+        """List user repositories (all pages)"""
         params = {
             'type': repo_type,  # all, owner, member
             'sort': sort,      # created, updated, pushed, full_name
@@ -165,32 +695,17 @@ class GitHubAPIClient:
         else:
             # Get authenticated user's repos
             endpoint = 'user/repos'
-            result = self._make_request('GET', endpoint, params=params)
-            return result
+            result = self._fetch_all_pages(endpoint, params)
+            if not result['success']:
+                return result
+            pages = result.pop('pages')
+            return {**result, 'data': [repo for page in pages for repo in page]}
         
-        endpoint = f"users/{user}/repos"
-        result = self._make_request('GET', endpoint, params=params)
+        endpoint = f"{_user_endpoint(user)}/repos"
+        result = self._fetch_all_pages(endpoint, params)
         
         if result['success']:
-            repos = result['data']
-            repo_list = []
-            
-            for repo in repos:
-                repo_list.append({
-                    'name': repo.get('name'),
-                    'full_name': repo.get('full_name'),
-                    'description': repo.get('description'),
-                    'clone_url': repo.get('clone_url'),
-                    'ssh_url': repo.get('ssh_url'),
-                    'html_url': repo.get('html_url'),
-                    'private': repo.get('private'),
-                    'language': repo.get('language'),
-                    'stars': repo.get('stargazers_count'),
-                    'forks': repo.get('forks_count'),
-                    'open_issues': repo.get('open_issues_count'),
-                    'created_at': repo.get('created_at'),
-                    'updated_at': repo.get('updated_at')
-                })
+            repo_list = [_repository_list_entry(repo) for page in result['pages'] for repo in page]
             
             logging.info(f"Retrieved {len(repo_list)} repositories")
             return {
@@ -212,7 +727,7 @@ class GitHubAPIClient:
             'labels': labels or []
         }
         
-        endpoint = f"repos/{owner}/{repo_name}/issues"
+        endpoint = f"{_repo_endpoint(owner, repo_name)}/issues"
         
         logging.info(f"Creating issue in {owner}/{repo_name}: {title}")
         result = self._make_request('POST', endpoint, data)
@@ -246,7 +761,7 @@ class GitHubAPIClient:
             'body': body
         }
         
-        endpoint = f"repos/{owner}/{repo_name}/pulls"
+        endpoint = f"{_repo_endpoint(owner, repo_name)}/pulls"
         
         logging.info(f"Creating PR in {owner}/{repo_name}: {title}")
         result = self._make_request('POST', endpoint, data)
@@ -272,72 +787,160 @@ class GitHubAPIClient:
             return result
     
     def get_file_content(self, owner: str, repo_name: str, path: str, 
-                       ref: Optional[str] = None) -> Dict[str, Any]:
-        """Get file content from repository"""
+                       ref: Optional[str] = None, raw: bool = False) -> Dict[str, Any]:
+        """Get file content from repository.
+        
+        raw=True downloads the file bytes directly (no base64/JSON), returning them as
+        'raw_content'; the API then sends no metadata, so sha and download_url are None.
+        """
         params = {}
         if ref:
             params['ref'] = ref
         
-        endpoint = f"repos/{owner}/{repo_name}/contents/{path}"
+        endpoint = _contents_endpoint(owner, repo_name, path)
         
         logging.info(f"Fetching file content: {owner}/{repo_name}/{path}")
-        result = self._make_request('GET', endpoint, params=params)
-        
-        if result['success']:
-            file_data = result['data']
-            # Handle content encoding
-            content = file_data.get('content', '')
-            if file_data.get('encoding') == 'base64':
-                import base64
+        if raw:
+            result = self._cached_get(endpoint, params=params, extra_headers={'Accept': _RAW_ACCEPT})
+            if result['success']:
+                raw_bytes = result['raw_bytes']
                 try:
-                    content = base64.b64decode(content).decode('utf-8')
-                except Exception as e:
-                    logging.warning(f"Failed to decode base64 content: {e}")
+                    content = raw_bytes.decode('utf-8')
+                except UnicodeDecodeError:
                     content = ''
-            
+                return {
+                    'success': True,
+                    'file': {
+                        'name': path.rsplit('/', 1)[-1],
+                        'path': path,
+                        'size': len(raw_bytes),
+                        'encoding': None,
+                        'content': content,
+                        'raw_content': raw_bytes,
+                        'sha': None,
+                        'download_url': None
+                    },
+                    'platform': self.platform
+                }
+            logging.error(f"Failed to get file content: {result.get('error')}")
+            return result
+        
+        result = self._cached_get(endpoint, params=params)
+        
+        if result['success']:
             return {
                 'success': True,
-                'file': {
-                    'name': file_data.get('name'),
-                    'path': file_data.get('path'),
-                    'size': file_data.get('size'),
-                    'encoding': file_data.get('encoding'),
-                    'content': content,
-                    'sha': file_data.get('sha'),
-                    'download_url': file_data.get('download_url')
-                },
+                'file': _file_info(result['data']),
                 'platform': self.platform
             }
         else:
             logging.error(f"Failed to get file content: {result.get('error')}")
             return result
     
+    def download_file(self, owner: str, repo_name: str, path: str, destination: str,
+                      ref: Optional[str] = None) -> Dict[str, Any]:
+        """Stream a file's raw bytes to destination without holding it in memory.
+        
+        Uses the raw media type, which also serves files too large for the JSON
+        contents response (over 1 MB).
+        """
+        params = {'ref': ref} if ref else None
+        url = f"{self.base_url}/{_contents_endpoint(owner, repo_name, path)}"
+        
+        logging.info(f"Downloading file: {owner}/{repo_name}/{path} -> {destination}")
+        try:
+            self._throttle()
+            with self.session.get(url, params=params, headers={'Accept': _RAW_ACCEPT},
+                                  stream=True, timeout=30) as response:
+                self._update_rate_state(response.headers)
+                if response.status_code != 200:
+                    body = response.raw.read(_ERROR_BODY_LIMIT + 1, decode_content=True)
+                    logging.error(f"Failed to download file: HTTP {response.status_code}")
+                    return {
+                        'success': False,
+                        'error': _error_message(body, response.headers.get('Content-Type', '')),
+                        'status_code': response.status_code,
+                        'response_text': body[:_ERROR_TEXT_LIMIT].decode('utf-8', errors='replace')
+                    }
+        
+                size = 0
+                with open(destination, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
+        
+            return {
+                'success': True,
+                'file': {
+                    'name': path.rsplit('/', 1)[-1],
+                    'path': path,
+                    'size': size,
+                    'destination': destination
+                },
+                'platform': self.platform
+            }
+        except requests.exceptions.Timeout:
+            return {
+                'success': False,
+                'error': 'Request timeout',
+                'status_code': -1
+            }
+        except requests.exceptions.ConnectionError:
+            return {
+                'success': False,
+                'error': 'Connection error',
+                'status_code': -2
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Download failed: {str(e)}',
+                'status_code': -3
+            }
+    
     def create_or_update_file(self, owner: str, repo_name: str, path: str, 
-                           content: str, message: str = '', branch: str = 'main') -> Dict[str, Any]:
-        """Create or update a file in a repository"""
-        import base64
+                           content: Union[str, bytes], message: str = '', branch: str = 'main',
+                           sha: Optional[str] = None) -> Dict[str, Any]:
+        """Create or update a file in a repository.
+        
+        GitHub needs the current blob sha to update an existing file; when sha is
+        not given it is looked up (a revalidated GET). Only a 404 means the file is
+        created; any other lookup failure is returned as is.
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
         
         data = {
             'message': message or f'Update {path}',
-            'content': content,
+            'content': binascii.b2a_base64(content, newline=False).decode('ascii'),
             'branch': branch
         }
         
-        endpoint = f"repos/{owner}/{repo_name}/contents/{path}"
+        endpoint = _contents_endpoint(owner, repo_name, path)
+        
+        if sha is None:
+            existing = self._cached_get(endpoint, params={'ref': branch})
+            if existing['success']:
+                sha = existing['data'].get('sha') if isinstance(existing['data'], dict) else None
+            elif existing.get('status_code') != 404:
+                logging.error(f"Failed to look up file sha: {existing.get('error')}")
+                return existing
+        if sha:
+            data['sha'] = sha
         
         logging.info(f"Creating/updating file: {owner}/{repo_name}/{path}")
         result = self._make_request('PUT', endpoint, data)
         
         if result['success']:
-            file_data = result['data']
+            file_data = result['data'].get('content') or {}
             return {
                 'success': True,
                 'file': {
                     'name': file_data.get('name'),
                     'path': file_data.get('path'),
                     'size': file_data.get('size'),
-                    'sha': file_data.get('content', {}).get('sha'),
-                    'commit': file_data.get('commit')
+                    'sha': file_data.get('sha'),
+                    'commit': result['data'].get('commit')
                 },
                 'platform': self.platform
             }
@@ -345,15 +948,18 @@ class GitHubAPIClient:
             logging.error(f"Failed to create/update file: {result.get('error')}")
             return result
     
-    def get_user_info(self, username: Optional[str] = None) -> Dict[str, Any]:
-        """Get user information"""
+    def get_user_info(self, username: Optional[str] = None, fresh: bool = False) -> Dict[str, Any]:
+        """Get user information; fresh=True skips the response cache"""
         if username:
-            endpoint = f"users/{username}"
+            endpoint = _user_endpoint(username)
         else:
             endpoint = 'user'  # Get authenticated user
         
         logging.info(f"Fetching user info for: {username or 'authenticated user'}")
-        result = self._make_request('GET', endpoint)
+        if fresh:
+            result = self._make_request('GET', endpoint)
+        else:
+            result = self._cached_get(endpoint)
         
         if result['success']:
             user_data = result['data']
@@ -380,8 +986,8 @@ class GitHubAPIClient:
             return result
     
     def search_repositories(self, query: str, sort: str = 'stars', 
-                          order: str = 'desc', per_page: int = 30) -> Dict[str, Any]:
-        """Search repositories"""
+                          order: str = 'desc', per_page: int = 30, all_pages: bool = False) -> Dict[str, Any]:
+        """Search repositories (first page, or every page up to GitHub's 1000-result cap)"""
         params = {
             'q': query,
             'sort': sort,      # stars, forks, updated
@@ -392,26 +998,18 @@ class GitHubAPIClient:
         endpoint = 'search/repositories'
         
         logging.info(f"Searching repositories: {query}")
-        result = self._make_request('GET', endpoint, params=params)
+        result = self._cached_get(endpoint, params=params)
+        
+        if result['success'] and all_pages:
+            # Search allows about 30 requests a minute, so the remaining pages are
+            # fetched one at a time along the rel="next" links (which stop at
+            # GitHub's 1000-result cap) rather than all at once
+            result = self._fetch_all_pages(endpoint, params, first=result, sequential=True)
         
         if result['success']:
             search_data = result['data']
-            repos = []
-            
-            for repo in search_data.get('items', []):
-                repos.append({
-                    'name': repo.get('name'),
-                    'full_name': repo.get('full_name'),
-                    'description': repo.get('description'),
-                    'clone_url': repo.get('clone_url'),
-                    'html_url': repo.get('html_url'),
-                    'language': repo.get('language'),
-                    'stars': repo.get('stargazers_count'),
-                    'forks': repo.get('forks_count'),
-                    'open_issues': repo.get('open_issues_count'),
-                    'created_at': repo.get('created_at'),
-                    'updated_at': repo.get('updated_at')
-                })
+            items = [item for page in result.get('pages', [search_data]) for item in page.get('items', [])]
+            repos = [_project(repo, _SEARCH_REPO_FIELDS) for repo in items]
             
             logging.info(f"Found {len(repos)} repositories")
             return {
@@ -426,6 +1024,70 @@ class GitHubAPIClient:
             logging.error(f"Failed to search repositories: {result.get('error')}")
             return result
     
+    def graphql_query(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
+        """Run a GraphQL query; GraphQL errors are reported under 'errors'"""
+        result = self._make_request('POST', 'graphql', {'query': query, 'variables': variables or {}})
+        
+        if result['success']:
+            payload = result['data']
+            if payload.get('errors') and payload.get('data') is None:
+                return {
+                    'success': False,
+                    'error': payload['errors'][0].get('message', 'GraphQL error'),
+                    'errors': payload['errors'],
+                    'status_code': result['status_code']
+                }
+            return {
+                'success': True,
+                'data': payload.get('data') or {},
+                'errors': payload.get('errors', []),
+                'platform': self.platform
+            }
+        else:
+            logging.error(f"GraphQL query failed: {result.get('error')}")
+            return result
+    
+    def graphql_batch_repos(self, full_names: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several "owner/repo" repositories with one GraphQL request per batch.
+        
+        Results are in input order and shaped like get_repository's.
+        """
+        results = []
+        for start in range(0, len(full_names), _GRAPHQL_BATCH_SIZE):
+            batch = full_names[start:start + _GRAPHQL_BATCH_SIZE]
+            declarations = []
+            selections = []
+            variables = {}
+            for i, full_name in enumerate(batch):
+                owner, _, name = full_name.partition('/')
+                variables[f'o{i}'] = owner
+                variables[f'n{i}'] = name
+                declarations.append(f'$o{i}: String!, $n{i}: String!')
+                selections.append(f'r{i}: repository(owner: $o{i}, name: $n{i}) {{ {_GRAPHQL_REPO_FIELDS} }}')
+            query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+            
+            logging.info(f"Fetching {len(batch)} repositories via GraphQL")
+            result = self.graphql_query(query, variables)
+            if not result['success']:
+                results.extend(result for _ in batch)
+                continue
+            
+            for i, full_name in enumerate(batch):
+                node = result['data'].get(f'r{i}')
+                if node is None:
+                    results.append({
+                        'success': False,
+                        'error': f'Repository not found: {full_name}',
+                        'status_code': 404
+                    })
+                else:
+                    results.append({
+                        'success': True,
+                        'repository': _graphql_repository_info(node),
+                        'platform': self.platform
+                    })
+        return results
+    
     def get_rate_limit_info(self) -> Dict[str, Any]:
         """Get GitHub API rate limit information"""
         endpoint = 'rate_limit'
@@ -470,62 +1132,14 @@ class GitHubAPIClient:
     
     def get_help_text(self) -> str:
         """Get help text for GitHub API operations"""
-        return """
-🐙 GitHub API Client for Terry-the-Tool-Bot
-Windows 10/11 optimized with comprehensive GitHub integration
-
-📋 Supported Operations:
-• create-repo <name> - Create new repository
-• get-repo <owner>/<repo> - Get repository info
-• list-repos [user] - List repositories
-• create-issue <owner>/<repo> <title> - Create issue
-• create-pr <owner>/<repo> <title> - Create pull request
-• get-file <owner>/<repo>/<path> - Get file content
-• update-file <owner>/<repo>/<path> - Update file
-• get-user [username] - Get user info
-• search-repos <query> - Search repositories
-• rate-limit - Get API rate limit info
-• status - Get GitHub status
-
-⚙️ Features:
-• Windows-optimized requests
-• Token authentication
-• Rate limiting awareness
-• Error handling and retries
-• Base64 content encoding/decoding
-• Comprehensive data parsing
-
-🔑 Authentication:
-• Set GITHUB_TOKEN environment variable
-• Or provide token during initialization
-• Public operations work without token
-
-💡 Examples:
-• create-repo my-awesome-project
-• get-repo microsoft/vscode
-• list-repos octocat
-• create-issue myuser/myrepo "Bug in login"
-• create-pr myuser/myrepo "Fix login bug" feature/main
-• get-file microsoft/vscode/README.md
-• update-file myuser/myrepo/config.json
-• get-user torvalds
-• search-repos "machine learning python"
-• rate-limit
-• status
-
-🛠️ Windows Integration:
-• Native Windows path handling
-• Registry-based GitHub Desktop detection
-• PowerShell command compatibility
-• Long path support (>260 characters)
-• Windows-specific optimizations
-        """.strip()
+        return _HELP_TEXT
     
     def validate_authentication(self) -> Dict[str, Any]:
         """Validate GitHub API authentication"""
         if self.token:
-            # Test authentication with a simple request
-            result = self.get_user_info()
+            # Test authentication with a live request; a cached profile would
+            # keep "validating" a token that has since been revoked
+            result = self.get_user_info(fresh=True)
             if result['success']:
                 return {
                     'authenticated': True,
@@ -545,4 +1159,172 @@ Windows 10/11 optimized with comprehensive GitHub integration
                 'token_valid': False,
                 'message': 'No GitHub token provided',
                 'public_access_only': True
-            }
\ No newline at end of file
+            }
+
+
+class AsyncGitHubAPIClient:
+    """Asyncio GitHub API client for fanning out independent calls over one aiohttp session.
+    
+    Results have the same shape as the matching GitHubAPIClient methods. Requires aiohttp.
+    """
+    
+    def __init__(self, token: Optional[str] = None):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncGitHubAPIClient")
+        
+        self.token = token or os.getenv('GITHUB_TOKEN')
+        self.base_url = "https://api.github.com"
+        self.platform = platform.system()
+        self.headers = dict(_DEFAULT_HEADERS)
+        if self.token:
+            self.headers['Authorization'] = f'token {self.token}'
+        # Created on first use, inside the running event loop
+        self._session = None
+        
+        logging.info(f"Initialized async GitHub API client for {self.platform}")
+    
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Get (or create) the shared aiohttp session"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the aiohttp session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> 'AsyncGitHubAPIClient':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                            params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make API request with error handling"""
+        url = _request_url(self.base_url, endpoint, _query_key(params))
+        
+        try:
+            async with self._get_session().request(
+                method,
+                url,
+                data=_json.dumps(data) if data is not None else None
+            ) as response:
+                body = await response.read()
+                
+                if response.status == 200:
+                    return {
+                        'success': True,
+                        'data': _json.loads(body),
+                        'status_code': response.status,
+                        'headers': response.headers
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'error': _error_message(body, response.headers.get('Content-Type', '')),
+                        'status_code': response.status,
+                        'response_text': body[:_ERROR_TEXT_LIMIT].decode('utf-8', errors='replace')
+                    }
+                
+        except asyncio.TimeoutError:
+            return {
+                'success': False,
+                'error': 'Request timeout',
+                'status_code': -1
+            }
+        except aiohttp.ClientConnectionError:
+            return {
+                'success': False,
+                'error': 'Connection error',
+                'status_code': -2
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Request failed: {str(e)}',
+                'status_code': -3
+            }
+    
+    async def get_repository(self, owner: str, repo_name: str) -> Dict[str, Any]:
+        """Get repository information"""
+        result = await self._make_request('GET', _repo_endpoint(owner, repo_name))
+        
+        if result['success']:
+            return {
+                'success': True,
+                'repository': _repository_info(result['data']),
+                'platform': self.platform
+            }
+        else:
+            logging.error(f"Failed to get repository: {result.get('error')}")
+            return result
+    
+    async def list_repositories(self, user: Optional[str] = None, repo_type: str = 'all',
+                                sort: str = 'updated', direction: str = 'desc') -> Dict[str, Any]:
+        """List user repositories"""
+        params = {
+            'type': repo_type,
+            'sort': sort,
+            'direction': direction,
+            'per_page': 100
+        }
+        
+        if not user:
+            # Authenticated user's repos are returned unprojected, as in GitHubAPIClient
+            return await self._make_request('GET', 'user/repos', params=params)
+        
+        params['user'] = user
+        result = await self._make_request('GET', f"{_user_endpoint(user)}/repos", params=params)
+        
+        if result['success']:
+            repo_list = [_repository_list_entry(repo) for repo in result['data']]
+            return {
+                'success': True,
+                'repositories': repo_list,
+                'total_count': len(repo_list),
+                'platform': self.platform
+            }
+        else:
+            logging.error(f"Failed to list repositories: {result.get('error')}")
+            return result
+    
+    async def get_file_content(self, owner: str, repo_name: str, path: str,
+                               ref: Optional[str] = None) -> Dict[str, Any]:
+        """Get file content from repository"""
+        params = {'ref': ref} if ref else None
+        result = await self._make_request('GET', _contents_endpoint(owner, repo_name, path), params=params)
+        
+        if result['success']:
+            return {
+                'success': True,
+                'file': _file_info(result['data']),
+                'platform': self.platform
+            }
+        else:
+            logging.error(f"Failed to get file content: {result.get('error')}")
+            return result
+    
+    async def get_many_repositories(self, full_names: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several "owner/repo" repositories concurrently, in input order"""
+        return await asyncio.gather(*(
+            self.get_repository(*full_name.split('/', 1)) for full_name in full_names
+        ))
+    
+    async def get_many_files(self, owner: str, repo_name: str, paths: List[str],
+                             ref: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch several files from one repository concurrently, in input order"""
+        return await asyncio.gather(*(
+            self.get_file_content(owner, repo_name, path, ref) for path in paths
+        ))
@@ -3,12 +3,16 @@ GitHub Desktop Integration - Windows-specific GitHub Desktop support
 Provides seamless integration with GitHub Desktop for Windows users
 """
 
+import functools
 import os
 import platform
 import subprocess
 import logging
+import time
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Dict, Any
+from urllib.parse import quote
+from typing import Optional, Dict, Any, Tuple
 
 # Platform-specific imports
 if platform.system() == "Windows":
@@ -19,73 +23,195 @@ if platform.system() == "Windows":
 else:
     winreg = None
 
+
+# advapi32 RegGetValueW opens, reads and closes a registry value in one call;
+# bound once with explicit signatures (Windows only)
+if winreg is not None:
+    import ctypes
+    from ctypes import wintypes
+    
+    _RegGetValueW = ctypes.WinDLL('advapi32').RegGetValueW
+    _RegGetValueW.argtypes = [wintypes.HKEY, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                              wintypes.LPDWORD, wintypes.LPVOID, wintypes.LPDWORD]
+    _RegGetValueW.restype = wintypes.LONG
+else:
+    _RegGetValueW = None
+_RRF_RT_REG_SZ = 0x00000002
+_ERROR_MORE_DATA = 234
+
+
+def _read_registry_string(hive: int, subkey: str, value: str) -> Optional[str]:
+    """A REG_SZ registry value, or None if the key or value is missing"""
+    chars = 260
+    while True:
+        buffer = ctypes.create_unicode_buffer(chars)
+        size = wintypes.DWORD(ctypes.sizeof(buffer))
+        status = _RegGetValueW(hive, subkey, value, _RRF_RT_REG_SZ, None, buffer, ctypes.byref(size))
+        if status == _ERROR_MORE_DATA:
+            # size now holds the bytes needed, terminator included
+            chars = size.value // ctypes.sizeof(ctypes.c_wchar) + 1
+            continue
+        if status != 0:
+            return None
+        return buffer.value
+
+
+# Common install locations, the per-user install (the default) first
+_CANDIDATE_DESKTOP_PATHS = (
+    os.path.join(os.environ.get('LOCALAPPDATA', rf"C:\Users\{os.environ.get('USERNAME')}\AppData\Local"),
+                 'GitHubDesktop', 'GitHubDesktop.exe'),
+    os.path.join(os.environ.get('ProgramFiles', r"C:\Program Files"), 'GitHub Desktop', 'GitHubDesktop.exe'),
+    os.path.join(os.environ.get('ProgramFiles(x86)', r"C:\Program Files (x86)"), 'GitHub Desktop', 'GitHubDesktop.exe')
+)
+_DESKTOP_URL_SCHEME = 'x-github-client://'
+_DESKTOP_REGISTRY_KEY = r"SOFTWARE\GitHub\GitHubDesktop"
+
+# Desktop is launched detached from our console/process group; a launch counts as
+# failed only if the process exits non-zero within the check window
+_DETACHED_FLAGS = getattr(subprocess, 'DETACHED_PROCESS', 0) | getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0)
+_LAUNCH_CHECK_SECONDS = 1.0
+
+# validate_repo_path: seconds a successful result is reused, and entries kept per instance
+_VALIDATE_CACHE_TTL = 2.0
+_VALIDATE_CACHE_MAX_ENTRIES = 128
+
+# `GitHubDesktop.exe --version` output by (path, mtime), so an upgrade is re-queried
+_DESKTOP_VERSION_CACHE: Dict[Tuple[str, float], Optional[str]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _discover_desktop_path() -> Optional[str]:
+    """Locate GitHubDesktop.exe; done once per process since the install doesn't move"""
+    # Check common installation paths; one stat each, stopping at the first hit
+    for path in _CANDIDATE_DESKTOP_PATHS:
+        if os.path.isfile(path):
+            logging.info(f"Found GitHub Desktop at: {path}")
+            return path
+    
+    # Check Windows Registry (only if available), machine-wide then per-user install
+    if winreg is not None:
+        for hive, label in ((winreg.HKEY_LOCAL_MACHINE, "registry"),
+                            (winreg.HKEY_CURRENT_USER, "user registry")):
+            install_path = _read_registry_string(hive, _DESKTOP_REGISTRY_KEY, "InstallPath")
+            if install_path is None:
+                logging.debug(f"{label.capitalize()} check found no InstallPath")
+                continue
+            desktop_exe = os.path.join(install_path, "GitHubDesktop.exe")
+            if os.path.isfile(desktop_exe):
+                logging.info(f"Found GitHub Desktop via {label}: {desktop_exe}")
+                return desktop_exe
+    
+    return None
+
+
+# Help text returned by GitHubDesktopWindows.get_desktop_help
+_DESKTOP_HELP = """
+🖥 GitHub Desktop Integration for Windows
+
+📋 Available Operations:
+• Open in GitHub Desktop - Open repository in GUI
+• Clone with Desktop - Clone using GitHub Desktop interface
+• Sync with Desktop - Sync repository with GitHub Desktop
+
+⚙️ Features:
+• Automatic GitHub Desktop detection
+• Windows path handling (long paths, special characters)
+• Registry-based installation detection
+• Integration with Terry Git operations
+
+💡 Requirements:
+• GitHub Desktop installed on Windows 10/11
+• Git for Windows installed
+• Repository accessible locally
+
+🔗 Installation:
+Download GitHub Desktop from: https://desktop.github.com/
+
+📖 Examples:
+• "Open my-project in GitHub Desktop"
+• "Clone https://github.com/user/repo with Desktop"
+• "Sync repository with Desktop"
+""".strip()
+
+
 class GitHubDesktopWindows:
     """GitHub Desktop integration for Windows"""
     
+    _shared_instance = None
+    
+    def __new__(cls):
+        # Nothing to discover off Windows, so every caller can share one instance
+        if platform.system() == "Windows":
+            return super().__new__(cls)
+        if cls._shared_instance is None:
+            cls._shared_instance = super().__new__(cls)
+        return cls._shared_instance
+    
     def __init__(self):
-        self.desktop_available = False
-        self.winreg = None
+        if getattr(self, '_initialized', False):
+            return
+        self._initialized = True
+        self.winreg = winreg
+        self._validate_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         
         # Platform-specific initialization
-        if platform.system() == "Windows":
-            try:
-                import winreg
-                self.winreg = winreg
-                self.desktop_available = True
-            except ImportError:
-                logging.warning("Windows registry module not available")
-        
-        self.desktop_path = self._find_github_desktop()
+        if platform.system() == "Windows" and winreg is None:
+            logging.warning("Windows registry module not available")
+    
+    @cached_property
+    def desktop_path(self) -> Optional[str]:
+        """GitHub Desktop executable, looked up on first use rather than at construction"""
+        # Only check on Windows
+        if platform.system() != "Windows":
+            return None
         
-        if self.desktop_available:
-            logging.info(f"GitHub Desktop found at: {self.desktop_path}")
+        path = _discover_desktop_path()
+        if path:
+            logging.info(f"GitHub Desktop found at: {path}")
         else:
             logging.info("GitHub Desktop not found - integration unavailable")
+        return path
     
-    def _find_github_desktop(self) -> Optional[str]:
-        """Find GitHub Desktop installation on Windows"""
-        # Only check on Windows
-        if not self.desktop_available:
+    @property
+    def desktop_available(self) -> bool:
+        """Whether the GitHub Desktop executable was found"""
+        return self.desktop_path is not None
+    
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget the discovered GitHub Desktop location (e.g. after an install)"""
+        _discover_desktop_path.cache_clear()
+    
+    def _open_desktop_url(self, action: str, target: str) -> bool:
+        """Dispatch an x-github-client:// action via the Windows shell; False if unavailable"""
+        # ShellExecute forwards the URL to a running Desktop instead of spawning one;
+        # os.startfile only exists on Windows
+        startfile = getattr(os, 'startfile', None)
+        if startfile is None:
+            return False
+        try:
+            startfile(f"{_DESKTOP_URL_SCHEME}{action}/{target}")
+            return True
+        except OSError as e:
+            logging.debug(f"GitHub Desktop URL handler unavailable: {e}")
+            return False
+    
+    def _launch_desktop(self, *args: str) -> Optional[int]:
+        """Start GitHub Desktop detached; exit code if it quit within the launch check, else None"""
+        # Desktop is a GUI app that keeps running, so waiting for it to exit would
+        # only burn the timeout; just catch launches that fail straight away
+        process = subprocess.Popen(
+            [self.desktop_path, *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            creationflags=_DETACHED_FLAGS
+        )
+        try:
+            return process.wait(timeout=_LAUNCH_CHECK_SECONDS)
+        except subprocess.TimeoutExpired:
             return None
-            
-        # Check common installation paths
-        possible_paths = [
-            rf"C:\Users\{os.getenv('USERNAME')}\AppData\Local\GitHubDesktop\GitHubDesktop.exe",
-            r"C:\Program Files\GitHub Desktop\GitHubDesktop.exe",
-            r"C:\Program Files (x86)\GitHub Desktop\GitHubDesktop.exe"
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                logging.info(f"Found GitHub Desktop at: {path}")
-                return path
-        
-        # Check Windows Registry (only if available)
-        if self.winreg:
-            try:
-                with self.winreg.OpenKey(self.winreg.HKEY_LOCAL_MACHINE, 
-                                      r"SOFTWARE\GitHub\GitHubDesktop") as key:
-                    install_path = self.winreg.QueryValueEx(key, "InstallPath")[0]
-                    desktop_exe = os.path.join(install_path, "GitHubDesktop.exe")
-                    if os.path.exists(desktop_exe):
-                        logging.info(f"Found GitHub Desktop via registry: {desktop_exe}")
-                        return desktop_exe
-            except (FileNotFoundError, OSError) as e:
-                logging.debug(f"Registry check failed: {e}")
-            
-            # Check user registry
-            try:
-                with self.winreg.OpenKey(self.winreg.HKEY_CURRENT_USER, 
-                                      r"SOFTWARE\GitHub\GitHubDesktop") as key:
-                    install_path = self.winreg.QueryValueEx(key, "InstallPath")[0]
-                    desktop_exe = os.path.join(install_path, "GitHubDesktop.exe")
-                    if os.path.exists(desktop_exe):
-                        logging.info(f"Found GitHub Desktop via user registry: {desktop_exe}")
-                        return desktop_exe
-            except (FileNotFoundError, OSError) as e:
-                logging.debug(f"User registry check failed: {e}")
-        
-        return None
     
     def open_repo_in_desktop(self, repo_path: str) -> Dict[str, Any]:
         """Open repository in GitHub Desktop"""
@@ -105,11 +231,13 @@ class GitHubDesktopWindows:
             
             logging.info(f"Opening repository in GitHub Desktop: {normalized_path}")
             
-            result = subprocess.run([
-                self.desktop_path, '--open-repo', normalized_path
-            ], capture_output=True, text=True, timeout=30)
+            # Hand off through Desktop's URL handler when possible (no process spawn)
+            if self._open_desktop_url('openLocalRepo', quote(normalized_path, safe='')):
+                return_code = None
+            else:
+                return_code = self._launch_desktop('--open-repo', normalized_path)
             
-            if result.returncode == 0:
+            if not return_code:
                 return {
                     'success': True,
                     'message': f'Opened {repo_path} in GitHub Desktop',
@@ -120,17 +248,11 @@ class GitHubDesktopWindows:
             else:
                 return {
                     'success': False,
-                    'error': f'Failed to open in GitHub Desktop: {result.stderr}',
+                    'error': f'Failed to open in GitHub Desktop (exit code {return_code})',
                     'repo_path': repo_path,
-                    'return_code': result.returncode
+                    'return_code': return_code
                 }
                 
-        except subprocess.TimeoutExpired:
-            return {
-                'success': False,
-                'error': 'GitHub Desktop operation timeout',
-                'repo_path': repo_path
-            }
         except Exception as e:
             logging.error(f"Failed to open repo in GitHub Desktop: {e}")
             return {
@@ -158,14 +280,18 @@ class GitHubDesktopWindows:
             
             logging.info(f"Cloning {repo_url} using GitHub Desktop")
             
-            result = subprocess.run([
-                self.desktop_path, '--clone-repo', repo_url
-            ], capture_output=True, text=True, timeout=300)  # 5 minutes timeout
+            # Desktop appends .git to openRepo URLs itself
+            remote_url = repo_url[:-4] if repo_url.endswith('.git') else repo_url
+            if self._open_desktop_url('openRepo', remote_url):
+                return_code = None
+            else:
+                return_code = self._launch_desktop('--clone-repo', repo_url)
             
-            if result.returncode == 0:
+            if not return_code:
+                # The clone itself runs (and reports progress) in the Desktop window
                 return {
                     'success': True,
-                    'message': f'Successfully cloned {repo_name} using GitHub Desktop',
+                    'message': f'Started cloning {repo_name} in GitHub Desktop',
                     'repo_url': repo_url,
                     'target_path': clone_target,
                     'repo_name': repo_name,
@@ -174,17 +300,11 @@ class GitHubDesktopWindows:
             else:
                 return {
                     'success': False,
-                    'error': f'Failed to clone with GitHub Desktop: {result.stderr}',
+                    'error': f'Failed to clone with GitHub Desktop (exit code {return_code})',
                     'repo_url': repo_url,
-                    'return_code': result.returncode
+                    'return_code': return_code
                 }
                 
-        except subprocess.TimeoutExpired:
-            return {
-                'success': False,
-                'error': 'GitHub Desktop clone timeout',
-                'repo_url': repo_url
-            }
         except Exception as e:
             logging.error(f"Failed to clone with GitHub Desktop: {e}")
             return {
@@ -220,9 +340,10 @@ class GitHubDesktopWindows:
     
     def _normalize_windows_path(self, path: str) -> str:
         """Normalize path for GitHub Desktop on Windows"""
-        if not path:
+        # Fast path: already backslash-delimited and short enough to skip the long-path prefix
+        if not path or ('/' not in path and len(path) <= 260):
             return path
-            
+        
         # Convert to Path object for proper handling
         path_obj = Path(path)
         
@@ -247,76 +368,81 @@ class GitHubDesktopWindows:
         }
     
     def _get_desktop_version(self) -> Optional[str]:
-        """Get GitHub Desktop version"""
+        """Get GitHub Desktop version (cached until the executable changes)"""
         if not self.desktop_available:
             return None
-            
+        
+        # Spawning Desktop is slow; its version can only change when the exe is replaced
+        try:
+            cache_key = (self.desktop_path, os.path.getmtime(self.desktop_path))
+        except OSError as e:
+            logging.debug(f"Failed to get GitHub Desktop version: {e}")
+            return None
+        if cache_key in _DESKTOP_VERSION_CACHE:
+            return _DESKTOP_VERSION_CACHE[cache_key]
+        
+        version = None
         try:
             # Try to get version from executable properties
+            # Bytes mode: only the branch taken decodes its stream
             result = subprocess.run([
                 self.desktop_path, '--version'
-            ], capture_output=True, text=True, timeout=10)
+            ], stdin=subprocess.DEVNULL, capture_output=True, timeout=10)
             
             if result.returncode == 0:
-                return result.stdout.strip()
+                version = result.stdout.decode('utf-8', errors='replace').strip()
             else:
-                logging.warning(f"Could not get GitHub Desktop version: {result.stderr}")
-                return None
+                logging.warning(
+                    f"Could not get GitHub Desktop version: {result.stderr.decode('utf-8', errors='replace')}"
+                )
                 
         except Exception as e:
             logging.debug(f"Failed to get GitHub Desktop version: {e}")
-            return None
+        
+        _DESKTOP_VERSION_CACHE[cache_key] = version
+        return version
     
     def get_desktop_help(self) -> str:
         """Get GitHub Desktop integration help"""
-        return """
-🖥 GitHub Desktop Integration for Windows
-
-📋 Available Operations:
-• Open in GitHub Desktop - Open repository in GUI
-• Clone with Desktop - Clone using GitHub Desktop interface
-• Sync with Desktop - Sync repository with GitHub Desktop
-
-⚙️ Features:
-• Automatic GitHub Desktop detection
-• Windows path handling (long paths, special characters)
-• Registry-based installation detection
-• Integration with Terry Git operations
-
-💡 Requirements:
-• GitHub Desktop installed on Windows 10/11
-• Git for Windows installed
-• Repository accessible locally
-
-🔗 Installation:
-Download GitHub Desktop from: https://desktop.github.com/
-
-📖 Examples:
-• "Open my-project in GitHub Desktop"
-• "Clone https://github.com/user/repo with Desktop"
-• "Sync repository with Desktop"
-        """.strip()
+        return _DESKTOP_HELP
     
     def validate_repo_path(self, repo_path: str) -> Dict[str, Any]:
         """Validate repository path for GitHub Desktop"""
+        # Valid repos are remembered briefly so UI refreshes/retries skip the stat;
+        # failures aren't, so a freshly created repo is picked up straight away
+        cached = self._validate_cache.get(repo_path)
+        if cached is not None and time.monotonic() - cached[0] < _VALIDATE_CACHE_TTL:
+            return dict(cached[1])
+        
+        result = self._validate_repo_path(repo_path)
+        if result['valid']:
+            if len(self._validate_cache) >= _VALIDATE_CACHE_MAX_ENTRIES:
+                self._validate_cache.clear()
+            self._validate_cache[repo_path] = (time.monotonic(), result)
+            # Callers get their own copy; the cached dict stays untouched
+            return dict(result)
+        return result
+    
+    def _validate_repo_path(self, repo_path: str) -> Dict[str, Any]:
         try:
-            path_obj = Path(repo_path)
-            
-            # Check if path exists
-            if not path_obj.exists():
-                return {
-                    'valid': False,
-                    'error': f'Path does not exist: {repo_path}',
-                    'suggestions': [
-                        'Create the directory first',
-                        'Check the path spelling',
-                        'Use absolute path'
-                    ]
-                }
-            
-            # Check if it's a Git repository
-            git_dir = path_obj / '.git'
-            if not git_dir.exists():
+            # One stat on .git answers both questions for a valid repo; the parent
+            # is only checked when .git is missing
+            try:
+                os.stat(os.path.join(repo_path, '.git'))
+            except OSError:
+                # Missing, or repo_path is a file / unreadable: same answers as before
+                # Check if path exists
+                if not os.path.exists(repo_path):
+                    return {
+                        'valid': False,
+                        'error': f'Path does not exist: {repo_path}',
+                        'suggestions': [
+                            'Create the directory first',
+                            'Check the path spelling',
+                            'Use absolute path'
+                        ]
+                    }
+                
                 return {
                     'valid': False,
                     'error': f'Not a Git repository: {repo_path}',
@@ -329,9 +455,9 @@ Download GitHub Desktop from: https://desktop.github.com/
             
             return {
                 'valid': True,
-                'path': str(path_obj.absolute()),
-                'is_git_repo': git_dir.exists(),
-                'repo_name': path_obj.name
+                'path': os.path.abspath(repo_path),
+                'is_git_repo': True,
+                'repo_name': os.path.basename(repo_path.rstrip('/\\'))
             }
             
         except Exception as e:
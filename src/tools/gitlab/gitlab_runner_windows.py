@@ -5,15 +5,128 @@ Provides GitLab Runner setup and management on Windows platforms
 
 import os
 import platform
+import shutil
 import subprocess
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# Platform-specific imports
+if platform.system() == "Windows":
+    try:
+        import winreg
+    except ImportError:
+        winreg = None
+else:
+    winreg = None
+
+_POWERSHELL_ENGINE_KEY = r"SOFTWARE\Microsoft\PowerShell\3\PowerShellEngine"
+
+# Service Control Manager (advapi32), bound once so the runner service can be started,
+# stopped and queried in-process instead of spawning gitlab-runner.exe (Windows only)
+_RUNNER_SERVICE_NAME = 'gitlab-runner'
+_SC_MANAGER_CONNECT = 0x0001
+_SERVICE_QUERY_STATUS = 0x0004
+_SERVICE_START = 0x0010
+_SERVICE_STOP = 0x0020
+_SERVICE_CONTROL_STOP = 0x00000001
+_SERVICE_STOPPED = 1
+_SERVICE_STOP_PENDING = 3
+_SERVICE_RUNNING = 4
+_SERVICE_STATES = {
+    1: 'stopped', 2: 'start pending', 3: 'stop pending', 4: 'running',
+    5: 'continue pending', 6: 'pause pending', 7: 'paused'
+}
+_ERROR_SERVICE_ALREADY_RUNNING = 1056
+_ERROR_SERVICE_NOT_ACTIVE = 1062
+
+# ControlService(STOP) returns while the service is still stopping; wait for it like
+# `gitlab-runner stop` does, for at least this long or the service's own wait hint
+_SERVICE_STOP_TIMEOUT = 30.0
+_SERVICE_POLL_INTERVAL = 0.25
+
+_advapi32 = None
+if platform.system() == "Windows":
+    import ctypes
+    from ctypes import wintypes
+    
+    class _SERVICE_STATUS(ctypes.Structure):
+        _fields_ = [(name, wintypes.DWORD) for name in (
+            'dwServiceType', 'dwCurrentState', 'dwControlsAccepted', 'dwWin32ExitCode',
+            'dwServiceSpecificExitCode', 'dwCheckPoint', 'dwWaitHint'
+        )]
+    
+    try:
+        _advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+        _advapi32.OpenSCManagerW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+        _advapi32.OpenSCManagerW.restype = wintypes.HANDLE
+        _advapi32.OpenServiceW.argtypes = [wintypes.HANDLE, wintypes.LPCWSTR, wintypes.DWORD]
+        _advapi32.OpenServiceW.restype = wintypes.HANDLE
+        _advapi32.StartServiceW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPVOID]
+        _advapi32.StartServiceW.restype = wintypes.BOOL
+        _advapi32.ControlService.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(_SERVICE_STATUS)]
+        _advapi32.ControlService.restype = wintypes.BOOL
+        _advapi32.QueryServiceStatus.argtypes = [wintypes.HANDLE, ctypes.POINTER(_SERVICE_STATUS)]
+        _advapi32.QueryServiceStatus.restype = wintypes.BOOL
+        _advapi32.CloseServiceHandle.argtypes = [wintypes.HANDLE]
+        _advapi32.CloseServiceHandle.restype = wintypes.BOOL
+    except (OSError, AttributeError) as e:
+        logging.debug(f"Service Control Manager API unavailable: {e}")
+        _advapi32 = None
+
+
+def _scm_control(action: str) -> int:
+    """Start, stop or query the runner service; returns its current SERVICE_STATUS state"""
+    access = _SERVICE_QUERY_STATUS | {'start': _SERVICE_START, 'stop': _SERVICE_STOP}.get(action, 0)
+    
+    scm = _advapi32.OpenSCManagerW(None, None, _SC_MANAGER_CONNECT)
+    if not scm:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        service = _advapi32.OpenServiceW(scm, _RUNNER_SERVICE_NAME, access)
+        if not service:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            status = _SERVICE_STATUS()
+            if action == 'start' and not _advapi32.StartServiceW(service, 0, None):
+                error = ctypes.get_last_error()
+                if error != _ERROR_SERVICE_ALREADY_RUNNING:
+                    raise ctypes.WinError(error)
+            elif action == 'stop' and not _advapi32.ControlService(service, _SERVICE_CONTROL_STOP,
+                                                                 ctypes.byref(status)):
+                error = ctypes.get_last_error()
+                if error != _ERROR_SERVICE_NOT_ACTIVE:
+                    raise ctypes.WinError(error)
+            
+            if not _advapi32.QueryServiceStatus(service, ctypes.byref(status)):
+                raise ctypes.WinError(ctypes.get_last_error())
+            if action == 'stop':
+                deadline = time.monotonic() + max(_SERVICE_STOP_TIMEOUT, status.dwWaitHint / 1000)
+                while status.dwCurrentState == _SERVICE_STOP_PENDING and time.monotonic() < deadline:
+                    time.sleep(_SERVICE_POLL_INTERVAL)
+                    if not _advapi32.QueryServiceStatus(service, ctypes.byref(status)):
+                        raise ctypes.WinError(ctypes.get_last_error())
+            return status.dwCurrentState
+        finally:
+            _advapi32.CloseServiceHandle(service)
+    finally:
+        _advapi32.CloseServiceHandle(scm)
+
+
 class GitLabRunnerWindows:
     """GitLab Runner management for Windows"""
     
+    # gitlab-runner.exe locations already validated in this process, shared by all
+    # instances: None -> result of the default search, install_path -> its executable.
+    # Only hits are stored, so a runner installed later is still found.
+    _runner_path_cache: Dict[Optional[str], str] = {}
+    _runner_path_lock = threading.Lock()
+    
+    # PowerShell location and engine version, looked up once per process
+    _ps_validated: Optional[Dict[str, Optional[str]]] = None
+    
     def __init__(self, gitlab_url: str, registration_token: str):
         self.gitlab_url = gitlab_url.rstrip('/')
         self.registration_token = registration_token
@@ -29,6 +142,11 @@ class GitLabRunnerWindows:
     
     def _find_or_download_runner(self) -> Optional[str]:
         """Find or download GitLab Runner executable"""
+        with self._runner_path_lock:
+            cached = self._runner_path_cache.get(None)
+        if cached:
+            return cached
+        
         possible_paths = [
             r"C:\GitLab-Runner\gitlab-runner.exe",
             r"C:\Program Files\GitLab-Runner\gitlab-runner.exe",
@@ -36,8 +154,10 @@ class GitLabRunnerWindows:
         ]
         
         for path in possible_paths:
-            if os.path.exists(path):
+            if os.path.isfile(path):
                 logging.info(f"Found GitLab Runner at: {path}")
+                with self._runner_path_lock:
+                    self._runner_path_cache[None] = path
                 return path
         
         # If not found, offer to download
@@ -46,6 +166,19 @@ class GitLabRunnerWindows:
         
         return None
     
+    def _installed_runner(self, install_path: str) -> Optional[str]:
+        """gitlab-runner.exe under install_path if present (stat skipped once validated)"""
+        runner_exe = os.path.join(install_path, "gitlab-runner.exe")
+        with self._runner_path_lock:
+            if self._runner_path_cache.get(install_path) == runner_exe:
+                return runner_exe
+        
+        if not os.path.isfile(runner_exe):
+            return None
+        with self._runner_path_lock:
+            self._runner_path_cache[install_path] = runner_exe
+        return runner_exe
+    
     def install_runner_windows(self, install_path: str = r"C:\GitLab-Runner", 
                             description: str = "Terry-the-Tool-Bot Windows Runner") -> Dict[str, Any]:
         """Install GitLab Runner as Windows service"""
@@ -72,9 +205,9 @@ class GitLabRunnerWindows:
             os.makedirs(install_path, exist_ok=True)
             
             # Copy runner to installation path (if not already there)
-            runner_dest = os.path.join(install_path, "gitlab-runner.exe")
-            if not os.path.exists(runner_dest):
-                import shutil
+            runner_dest = self._installed_runner(install_path)
+            if runner_dest is None:
+                runner_dest = os.path.join(install_path, "gitlab-runner.exe")
                 shutil.copy2(self.runner_executable, runner_dest)
                 logging.info(f"Copied runner to: {runner_dest}")
             
@@ -95,9 +228,7 @@ class GitLabRunnerWindows:
             if result.returncode == 0:
                 # Start the service
                 logging.info("Starting GitLab Runner service...")
-                start_result = subprocess.run([
-                    runner_dest, 'start'
-                ], capture_output=True, text=True, cwd=install_path)
+                start_result = self._service_command(runner_dest, 'start', install_path)
                 
                 if start_result.returncode == 0:
                     return {
@@ -181,6 +312,23 @@ class GitLabRunnerWindows:
                 'platform': self.platform
             }
     
+    def _service_command(self, runner_exe: str, action: str, install_path: str) -> subprocess.CompletedProcess:
+        """Run `gitlab-runner start|stop|status`, through the SCM API when available"""
+        if _advapi32 is None:
+            return subprocess.run([runner_exe, action], capture_output=True, text=True, cwd=install_path)
+        
+        try:
+            state = _scm_control(action)
+        except OSError as e:
+            return subprocess.CompletedProcess([action], getattr(e, 'winerror', None) or 1, '', str(e))
+        
+        # Same shape as the CLI: status succeeds only while the service is running,
+        # stop only once it has fully stopped (its files are released)
+        message = f"{_RUNNER_SERVICE_NAME}: Service is {_SERVICE_STATES.get(state, 'unknown')}"
+        if (action == 'status' and state != _SERVICE_RUNNING) or (action == 'stop' and state != _SERVICE_STOPPED):
+            return subprocess.CompletedProcess([action], 1, message, message)
+        return subprocess.CompletedProcess([action], 0, message, '')
+    
     def start_runner_service(self, install_path: str = r"C:\GitLab-Runner") -> Dict[str, Any]:
         """Start GitLab Runner service on Windows"""
         if not self.is_windows:
@@ -190,9 +338,9 @@ class GitLabRunnerWindows:
                 'platform': self.platform
             }
         
-        runner_exe = os.path.join(install_path, "gitlab-runner.exe")
+        runner_exe = self._installed_runner(install_path)
         
-        if not os.path.exists(runner_exe):
+        if runner_exe is None:
             return {
                 'success': False,
                 'error': 'GitLab Runner not found at installation path',
@@ -200,10 +348,8 @@ class GitLabRunnerWindows:
             }
         
         try:
-            start_cmd = [runner_exe, 'start']
-            
             logging.info("Starting GitLab Runner service...")
-            result = subprocess.run(start_cmd, capture_output=True, text=True, cwd=install_path)
+            result = self._service_command(runner_exe, 'start', install_path)
             
             if result.returncode == 0:
                 return {
@@ -238,9 +384,9 @@ class GitLabRunnerWindows:
                 'platform': self.platform
             }
         
-        runner_exe = os.path.join(install_path, "gitlab-runner.exe")
+        runner_exe = self._installed_runner(install_path)
         
-        if not os.path.exists(runner_exe):
+        if runner_exe is None:
             return {
                 'success': False,
                 'error': 'GitLab Runner not found at installation path',
@@ -248,10 +394,8 @@ class GitLabRunnerWindows:
             }
         
         try:
-            stop_cmd = [runner_exe, 'stop']
-            
             logging.info("Stopping GitLab Runner service...")
-            result = subprocess.run(stop_cmd, capture_output=True, text=True, cwd=install_path)
+            result = self._service_command(runner_exe, 'stop', install_path)
             
             if result.returncode == 0:
                 return {
@@ -286,9 +430,9 @@ class GitLabRunnerWindows:
                 'platform': self.platform
             }
         
-        runner_exe = os.path.join(install_path, "gitlab-runner.exe")
+        runner_exe = self._installed_runner(install_path)
         
-        if not os.path.exists(runner_exe):
+        if runner_exe is None:
             return {
                 'success': False,
                 'error': 'GitLab Runner not found at installation path',
@@ -297,9 +441,7 @@ class GitLabRunnerWindows:
             }
         
         try:
-            status_cmd = [runner_exe, 'status']
-            
-            result = subprocess.run(status_cmd, capture_output=True, text=True, cwd=install_path)
+            result = self._service_command(runner_exe, 'status', install_path)
             
             if result.returncode == 0:
                 # Parse status output
@@ -336,9 +478,9 @@ class GitLabRunnerWindows:
                 'platform': self.platform
             }
         
-        runner_exe = os.path.join(install_path, "gitlab-runner.exe")
+        runner_exe = self._installed_runner(install_path)
         
-        if not os.path.exists(runner_exe):
+        if runner_exe is None:
             return {
                 'success': False,
                 'error': 'GitLab Runner not found at installation path',
@@ -358,19 +500,27 @@ class GitLabRunnerWindows:
                 
                 if result.returncode == 0:
                     # Remove installation directory
+                    warning = None
                     try:
-                        import shutil
+                        # Forget this location, and the default search result (it may be this copy)
+                        with self._runner_path_lock:
+                            self._runner_path_cache.pop(install_path, None)
+                            self._runner_path_cache.pop(None, None)
                         shutil.rmtree(install_path)
                         logging.info(f"Removed installation directory: {install_path}")
                     except Exception as e:
-                        logging.warning(f"Failed to remove installation directory: {e}")
+                        warning = f'Failed to remove installation directory: {e}'
+                        logging.warning(warning)
                     
-                    return {
+                    response = {
                         'success': True,
                         'message': 'GitLab Runner uninstalled successfully',
                         'install_path': install_path,
                         'platform': self.platform
                     }
+                    if warning:
+                        response['warning'] = warning
+                    return response
                 else:
                     return {
                         'success': False,
@@ -436,6 +586,21 @@ class GitLabRunnerWindows:
 • Service runs under SYSTEM account
         """.strip()
     
+    @classmethod
+    def _powershell_info(cls) -> Dict[str, Optional[str]]:
+        """PowerShell path and version, found without starting a PowerShell host"""
+        if cls._ps_validated is None:
+            path = shutil.which('powershell') or shutil.which('pwsh')
+            version = None
+            if path and winreg is not None:
+                try:
+                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _POWERSHELL_ENGINE_KEY) as key:
+                        version = winreg.QueryValueEx(key, "PowerShellVersion")[0]
+                except OSError as e:
+                    logging.debug(f"Could not read PowerShell version: {e}")
+            cls._ps_validated = {'path': path, 'version': version}
+        return cls._ps_validated
+    
     def validate_windows_requirements(self) -> Dict[str, Any]:
         """Validate Windows requirements for GitLab Runner"""
         if not self.is_windows:
@@ -465,11 +630,13 @@ class GitLabRunnerWindows:
             logging.debug("Could not determine Windows version")
         
         # Check PowerShell availability
-        try:
-            subprocess.run(['powershell', '-Command', 'Get-Host'], 
-                         capture_output=True, check=True, timeout=5)
-        except subprocess.CalledProcessError:
+        powershell = self._powershell_info()
+        if powershell['path'] is None:
             issues.append('PowerShell not available')
+        else:
+            major = (powershell['version'] or '').split('.')[0]
+            if major.isdigit() and int(major) < 5:
+                issues.append('PowerShell 5+ required')
         
         return {
             'valid': len(issues) == 0,
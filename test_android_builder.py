@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for the Android builder tool: input matching, project generation and tool info
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from tools.android_builder import AndroidBuilderTool
+
+
+def test_validate_input_matches_whole_words():
+    tool = AndroidBuilderTool()
+
+    assert tool.validate_input('Create an Android app')
+    assert tool.validate_input('build me a kotlin project')
+    assert not tool.validate_input('an androgynous character')
+    assert not tool.validate_input('happy birthday')
+
+
+def test_execute_creates_project(tmp_path):
+    tool = AndroidBuilderTool()
+
+    result = tool.execute('create android app called Foo', {'projects_dir': str(tmp_path)})
+
+    assert result['status'] == 'success'
+    project = tmp_path / 'Foo'
+    assert 'rootProject.name = "Foo"' in (project / 'settings.gradle.kts').read_text()
+    build_script = (project / 'build.gradle.kts').read_text()
+    assert 'applicationId "com.terry.foo"' in build_script
+    assert '{' in build_script and '{{' not in build_script
+
+
+def test_get_info_returns_a_copy():
+    tool = AndroidBuilderTool()
+
+    info = tool.get_info()
+    info['name'] = 'changed'
+
+    assert tool.get_info()['name'] == 'android_builder'
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for the Git tool: intent parsing, batched adds, commit hashes and status parsing
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from tools.git import windows_git_manager
+from tools.git.cross_platform_git import UnixGitManager, _parse_porcelain_v2
+from tools.git.terry_git_tool import TerryGitTool
+from tools.git.windows_git_manager import WindowsGitManager
+
+needs_git = pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    for variable in ('GIT_AUTHOR_NAME', 'GIT_COMMITTER_NAME'):
+        monkeypatch.setenv(variable, 'Terry')
+    for variable in ('GIT_AUTHOR_EMAIL', 'GIT_COMMITTER_EMAIL'):
+        monkeypatch.setenv(variable, 'terry@example.com')
+    subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+    (tmp_path / 'a.txt').write_text('a')
+    (tmp_path / 'b.txt').write_text('b')
+    return tmp_path
+
+
+def staged_files(repo_path):
+    result = subprocess.run(['git', 'diff', '--cached', '--name-only'],
+                            cwd=repo_path, capture_output=True, text=True, check=True)
+    return sorted(result.stdout.split())
+
+
+def test_parse_git_intent_keeps_table_priority():
+    tool = TerryGitTool()
+
+    operation = tool._parse_git_intent('please merge feature into main')
+    assert operation['type'] == 'merge'
+    assert operation['args'] == ['feature']
+
+    operation = tool._parse_git_intent('commit with message "fix login"')
+    assert operation['type'] == 'commit'
+    assert operation['args'] == ['fix login']
+
+    assert tool._parse_git_intent('hello there') is None
+
+
+@needs_git
+def test_batched_add_reports_one_result(repo):
+    result = TerryGitTool()._handle_add_operation(['a.txt', 'b.txt'], {'current_directory': str(repo)})
+
+    assert result['success']
+    assert result['files_added'] == 2
+    assert len(result['details']) == 1
+    assert result['details'][0]['file_patterns'] == ['a.txt', 'b.txt']
+    assert staged_files(repo) == ['a.txt', 'b.txt']
+
+
+@needs_git
+def test_batched_add_names_the_failing_pattern(repo):
+    result = TerryGitTool()._handle_add_operation(['a.txt', 'missing.txt', 'b.txt'],
+                                                  {'current_directory': str(repo)})
+
+    assert not result['success']
+    assert result['failed_patterns'] == ['missing.txt']
+    assert result['files_added'] == 2
+    assert staged_files(repo) == ['a.txt', 'b.txt']
+
+
+@needs_git
+@pytest.mark.parametrize('manager_cls', [UnixGitManager, WindowsGitManager])
+def test_commit_returns_full_sha(repo, manager_cls):
+    manager = manager_cls()
+    try:
+        result = manager.commit_changes('Initial commit', ['a.txt'], str(repo))
+    finally:
+        manager.close()
+
+    head = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=repo,
+                          capture_output=True, text=True, check=True).stdout.strip()
+    assert result['success']
+    assert result['commit_hash'] == head
+    assert len(result['commit_hash']) == 40
+
+
+def test_tokenize_keeps_windows_backslashes(monkeypatch):
+    monkeypatch.setattr(windows_git_manager, '_SYSTEM', 'Windows')
+
+    assert windows_git_manager._tokenize(r'add C:\repo\file "my dir\sub file"') == [
+        'add', r'C:\repo\file', r'my dir\sub file'
+    ]
+
+
+def test_tokenize_uses_posix_rules_elsewhere(monkeypatch):
+    monkeypatch.setattr(windows_git_manager, '_SYSTEM', 'Linux')
+
+    assert windows_git_manager._tokenize(r'commit -m "two words" a\ b') == [
+        'commit', '-m', 'two words', 'a b'
+    ]
+
+
+def test_parse_porcelain_v2_columns():
+    blob = (
+        '# branch.oid (initial)\n'
+        '# branch.head main\n'
+        '1 .M N... 100644 100644 100644 3f4e 3f4e src/app.py\n'
+        '2 R. N... 100644 100644 100644 9a1b 9a1b R100 new name.txt\told name.txt\n'
+        'u UU N... 100644 100644 100755 100755 aaaa bbbb cccc conflict.sh\n'
+        '? notes.txt\n'
+    )
+
+    assert _parse_porcelain_v2(blob) == {
+        'paths': ('src/app.py', 'new name.txt', 'conflict.sh', 'notes.txt'),
+        'xy': ('.M', 'R.', 'UU', '??'),
+        'modes': (0o100644, 0o100644, 0o100755, 0),
+        'orig_paths': ('', 'old name.txt', '', '')
+    }
+
+
+@needs_git
+def test_get_status_lists_untracked_files(repo):
+    manager = UnixGitManager()
+    try:
+        status = manager.get_status(str(repo))
+    finally:
+        manager.close()
+
+    assert status['success']
+    assert status['paths'] == ('a.txt', 'b.txt')
+    assert status['xy'] == ('??', '??')
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub API client: retries, response caching and pagination
+"""
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from tools.github import github_api_client
+from tools.github.github_api_client import GitHubAPIClient, _ADAPTER, _RATE_LIMIT_MAX_WAIT
+
+
+def make_response(status_code, body=b'{}', headers=None):
+    """Build a requests.Response without a network round trip"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers = CaseInsensitiveDict({'Content-Type': 'application/json', **(headers or {})})
+    return response
+
+
+class FakeSession:
+    """Stands in for requests.Session, answering from a list of responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.headers = {}
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        self.calls.append({'method': method, 'url': url, 'data': data, 'headers': dict(headers or {})})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.delenv('TERRY_GITHUB_CACHE', raising=False)
+    monkeypatch.setattr(github_api_client.time, 'sleep', lambda seconds: None)
+    return GitHubAPIClient(token='test-token')
+
+
+def test_adapter_retries_only_idempotent_server_errors():
+    retries = _ADAPTER.max_retries
+    assert 429 not in retries.status_forcelist
+    assert 503 in retries.status_forcelist
+    assert 'PUT' not in retries.allowed_methods
+    assert 'POST' not in retries.allowed_methods
+
+def test_retry_after_is_capped(client, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(github_api_client.time, 'sleep', sleeps.append)
+    client.session = FakeSession([
+        make_response(429, b'{"message": "slow down"}', {'Retry-After': '3600'}),
+        make_response(200, b'{"login": "octocat"}')
+    ])
+
+    result = client._make_request('GET', 'user')
+
+    assert result['success']
+    assert sleeps == [_RATE_LIMIT_MAX_WAIT]
+    assert len(client.session.calls) == 2
+
+
+def test_rate_limit_retried_only_once(client):
+    client.session = FakeSession([
+        make_response(429, b'{"message": "slow down"}', {'Retry-After': '1'}),
+        make_response(429, b'{"message": "still slow"}', {'Retry-After': '1'})
+    ])
+
+    result = client._make_request('GET', 'user')
+
+    assert not result['success']
+    assert result['status_code'] == 429
+    assert result['error'] == 'still slow'
+
+def test_not_modified_reuses_cached_result(client):
+    client.session = FakeSession([
+        make_response(200, b'{"name": "repo"}', {'ETag': '"abc"'}),
+        make_response(304, b'')
+    ])
+
+    first = client._cached_get('repos/octocat/repo')
+    second = client._cached_get('repos/octocat/repo')
+
+    assert second['data'] == first['data'] == {'name': 'repo'}
+    assert client.session.calls[1]['headers']['If-None-Match'] == '"abc"'
+
+
+def test_cached_results_are_copies(client):
+    client.session = FakeSession([
+        make_response(200, b'{"name": "repo", "topics": ["a"]}', {'ETag': '"abc"'}),
+        make_response(304, b''),
+        make_response(304, b'')
+    ])
+
+    first = client._cached_get('repos/octocat/repo')
+    first['data']['topics'].append('changed')
+    first['headers']['ETag'] = 'changed'
+    second = client._cached_get('repos/octocat/repo')
+    second['data']['name'] = 'changed'
+
+    third = client._cached_get('repos/octocat/repo')
+    assert third['data'] == {'name': 'repo', 'topics': ['a']}
+    assert third['headers']['ETag'] == '"abc"'
+
+
+def test_validate_authentication_skips_the_cache(client):
+    client.session = FakeSession([
+        make_response(200, b'{"login": "octocat"}', {'ETag': '"abc"'}),
+        make_response(401, b'{"message": "Bad credentials"}')
+    ])
+
+    assert client.get_user_info()['success']
+    result = client.validate_authentication()
+
+    assert not result['token_valid']
+    assert result['error'] == 'Bad credentials'
+    assert len(client.session.calls) == 2
+
+
+def test_disk_cache_is_opt_in(client):
+    assert client._disk_cache is None
+
+
+def test_disk_cache_is_private_and_skips_raw_bodies(monkeypatch, tmp_path):
+    cache_path = tmp_path / 'cache' / 'gh.sqlite'
+    monkeypatch.setenv('TERRY_GITHUB_CACHE', str(cache_path))
+    client = GitHubAPIClient(token='test-token')
+
+    assert stat.S_IMODE(os.stat(cache_path.parent).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+
+    client.session = FakeSession([
+        make_response(200, b'{"name": "repo"}', {'ETag': '"json"'}),
+        make_response(200, b'file bytes', {'ETag': '"raw"', 'Content-Type': 'application/octet-stream'})
+    ])
+    client._cached_get('repos/octocat/repo')
+    client._cached_get('repos/octocat/repo/contents/a.txt',
+                       extra_headers={'Accept': github_api_client._RAW_ACCEPT})
+
+    etags = [row[0] for row in client._disk_cache.execute('SELECT etag FROM cache')]
+    assert etags == ['"json"']
+
+    # A second client in the same process shares the connection opened for this path
+    assert GitHubAPIClient(token='test-token')._disk_cache is client._disk_cache
+
+def test_list_repositories_follows_every_page(client):
+    link = '<https://api.github.com/users/octocat/repos?page=3>; rel="last"'
+    client.session = FakeSession([
+        make_response(200, b'[{"name": "a"}]', {'Link': link}),
+        make_response(200, b'[{"name": "b"}]'),
+        make_response(200, b'[{"name": "c"}]')
+    ])
+
+    result = client.list_repositories(user='octocat')
+
+    assert result['success']
+    assert sorted(repo['name'] for repo in result['repositories']) == ['a', 'b', 'c']
+    assert result['total_count'] == 3
+
+
+def test_search_pages_are_fetched_one_at_a_time(client):
+    def page(number, next_page=None):
+        links = ['<https://api.github.com/search/repositories?q=x&page=3>; rel="last"']
+        if next_page:
+            links.append(f'<https://api.github.com/search/repositories?q=x&page={next_page}>; rel="next"')
+        body = f'{{"total_count": 3, "items": [{{"name": "r{number}"}}]}}'.encode()
+        return make_response(200, body, {'Link': ', '.join(links)})
+
+    client.session = FakeSession([page(1, 2), page(2, 3), page(3)])
+
+    result = client.search_repositories('x', per_page=1, all_pages=True)
+
+    assert result['success']
+    assert [repo['name'] for repo in result['repositories']] == ['r1', 'r2', 'r3']
+    pages = [parse_qs(urlparse(call['url']).query)['page'] for call in client.session.calls[1:]]
+    assert pages == [['2'], ['3']]
+    assert len(client.session.calls) == 3
+
+
+def test_update_looks_up_the_existing_sha(client):
+    client.session = FakeSession([
+        make_response(200, b'{"sha": "old-sha", "path": "README.md"}'),
+        make_response(200, b'{"content": {"path": "README.md", "sha": "new-sha"}}'),
+    ])
+    result = client.create_or_update_file('owner', 'repo', 'README.md', 'hello')
+    assert result['success']
+    assert [call['method'] for call in client.session.calls] == ['GET', 'PUT']
+    assert json.loads(client.session.calls[1]['data'])['sha'] == 'old-sha'
+
+
+def test_missing_file_is_created(client):
+    client.session = FakeSession([
+        make_response(404, b'{"message": "Not Found"}'),
+        make_response(201, b'{"content": {"path": "README.md", "sha": "new-sha"}}'),
+    ])
+    result = client.create_or_update_file('owner', 'repo', 'README.md', 'hello')
+    assert result['success']
+    assert 'sha' not in json.loads(client.session.calls[1]['data'])
+
+
+def test_failed_sha_lookup_is_returned(client):
+    client.session = FakeSession([make_response(403, b'{"message": "Forbidden"}')])
+    result = client.create_or_update_file('owner', 'repo', 'README.md', 'hello')
+    assert not result['success']
+    assert result['status_code'] == 403
+    assert [call['method'] for call in client.session.calls] == ['GET']
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub Desktop integration: repository path validation and instance sharing
+"""
+
+import platform
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from tools.github.github_desktop_integration import GitHubDesktopWindows
+
+
+def test_validate_repo_path_accepts_a_repository(tmp_path):
+    (tmp_path / '.git').mkdir()
+
+    result = GitHubDesktopWindows().validate_repo_path(str(tmp_path))
+
+    assert result['valid']
+    assert result['repo_name'] == tmp_path.name
+
+
+def test_validate_repo_path_rejects_a_regular_file(tmp_path):
+    repo_file = tmp_path / 'notes.txt'
+    repo_file.write_text('not a repository')
+
+    result = GitHubDesktopWindows().validate_repo_path(str(repo_file))
+
+    assert not result['valid']
+    assert result['error'] == f'Not a Git repository: {repo_file}'
+
+
+def test_validate_repo_path_reports_a_missing_path(tmp_path):
+    missing = tmp_path / 'missing'
+
+    result = GitHubDesktopWindows().validate_repo_path(str(missing))
+
+    assert not result['valid']
+    assert result['error'] == f'Path does not exist: {missing}'
+
+
+def test_validate_repo_path_returns_copies_of_cached_results(tmp_path):
+    (tmp_path / '.git').mkdir()
+    desktop = GitHubDesktopWindows()
+
+    first = desktop.validate_repo_path(str(tmp_path))
+    first['valid'] = False
+    (tmp_path / '.git').rmdir()
+    second = desktop.validate_repo_path(str(tmp_path))
+
+    # Still inside the cache TTL, so .git is not looked at again
+    assert second['valid']
+    assert second is not first
+
+
+def test_instance_is_shared_off_windows(monkeypatch):
+    monkeypatch.setattr(platform, 'system', lambda: 'Linux')
+
+    assert GitHubDesktopWindows() is GitHubDesktopWindows()
+
+
+def test_instances_are_separate_on_windows(monkeypatch):
+    monkeypatch.setattr(platform, 'system', lambda: 'Windows')
+
+    assert GitHubDesktopWindows() is not GitHubDesktopWindows()
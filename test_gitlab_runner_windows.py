@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for GitLab Runner service control through the Service Control Manager API
+"""
+
+import ctypes
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from tools.gitlab import gitlab_runner_windows
+from tools.gitlab.gitlab_runner_windows import GitLabRunnerWindows
+
+
+class ServiceStatus(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_uint32) for name in (
+        'dwServiceType', 'dwCurrentState', 'dwControlsAccepted', 'dwWin32ExitCode',
+        'dwServiceSpecificExitCode', 'dwCheckPoint', 'dwWaitHint'
+    )]
+
+
+class FakeAdvapi32:
+    """advapi32 stand-in whose service reports the given states, one per query"""
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.controls = []
+
+    def OpenSCManagerW(self, machine, database, access):
+        return 1
+
+    def OpenServiceW(self, scm, name, access):
+        return 2
+
+    def StartServiceW(self, service, argc, argv):
+        return 1
+
+    def ControlService(self, service, control, status):
+        self.controls.append(control)
+        return 1
+
+    def QueryServiceStatus(self, service, status):
+        status._obj.dwCurrentState = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        status._obj.dwWaitHint = 0
+        return 1
+
+    def CloseServiceHandle(self, handle):
+        return 1
+
+
+@pytest.fixture
+def fake_scm(monkeypatch):
+    def install(states):
+        advapi32 = FakeAdvapi32(states)
+        monkeypatch.setattr(gitlab_runner_windows, '_advapi32', advapi32)
+        monkeypatch.setattr(gitlab_runner_windows, '_SERVICE_STATUS', ServiceStatus, raising=False)
+        monkeypatch.setattr(gitlab_runner_windows, 'ctypes', ctypes, raising=False)
+        monkeypatch.setattr(gitlab_runner_windows, '_SERVICE_POLL_INTERVAL', 0.01)
+        return advapi32
+    return install
+
+
+def runner():
+    return GitLabRunnerWindows.__new__(GitLabRunnerWindows)
+
+
+def test_stop_waits_for_the_service_to_stop(fake_scm):
+    advapi32 = fake_scm([3, 3, 3, 1])
+
+    result = runner()._service_command('gitlab-runner.exe', 'stop', '.')
+
+    assert result.returncode == 0
+    assert advapi32.controls == [gitlab_runner_windows._SERVICE_CONTROL_STOP]
+    assert advapi32.states == [1]
+
+
+def test_stop_fails_while_still_stop_pending(fake_scm, monkeypatch):
+    fake_scm([3])
+    monkeypatch.setattr(gitlab_runner_windows, '_SERVICE_STOP_TIMEOUT', 0.05)
+
+    result = runner()._service_command('gitlab-runner.exe', 'stop', '.')
+
+    assert result.returncode == 1
+    assert 'stop pending' in result.stderr
+
+
+def test_start_and_status_report_running(fake_scm):
+    fake_scm([4])
+
+    assert runner()._service_command('gitlab-runner.exe', 'start', '.').returncode == 0
+    status = runner()._service_command('gitlab-runner.exe', 'status', '.')
+    assert status.returncode == 0
+    assert 'running' in status.stdout
+
+
+def test_status_of_stopped_service_fails(fake_scm):
+    fake_scm([1])
+
+    status = runner()._service_command('gitlab-runner.exe', 'status', '.')
+
+    assert status.returncode == 1
+    assert 'stopped' in status.stderr